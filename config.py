@@ -12,6 +12,16 @@ DEFAULT_OUTPUT_FILE = "ingredients_analyzed.csv"
 REQUEST_TIMEOUT_SECONDS = 15
 REQUEST_DELAY_SECONDS   = 1.0   # Polite delay between requests to same domain
 MAX_RETRIES             = 3
+MAX_CONCURRENT_PER_DOMAIN = 10   # Cap on simultaneous browser sessions per site
+BROWSER_MAX_PAGES       = 200   # Relaunch a shared Chromium after this many pages
+
+# Scrape results persist between runs in a small SQLite file.
+# Set INGREDIENT_ANALYZER_CACHE="" to keep the cache in memory only.
+SCRAPE_CACHE_PATH = os.getenv(
+    "INGREDIENT_ANALYZER_CACHE",
+    os.path.join(os.path.expanduser("~"), ".cache", "ingredient-analyzer", "scrape_cache.sqlite"),
+)
+SCRAPE_CACHE_TTL_DAYS = 30   # Older rows are re-scraped
 
 USER_AGENT = (
     "Mozilla/5.0 (compatible; IngredientAnalyzer/1.0; "
@@ -24,4 +34,6 @@ LLM_MODEL   = "claude-sonnet-4-6"
 LLM_ENABLED = False   # Set to True to activate LLM fallback enrichers
 
 # ── Concurrency ───────────────────────────────────────────────────────────────
-MAX_WORKERS = 4   # Parallel threads for processing multiple ingredients
+# Parallel threads for processing multiple ingredients. The pipeline is
+# I/O-bound (scraping), so this is well above the CPU count.
+MAX_WORKERS = int(os.getenv("INGREDIENT_ANALYZER_WORKERS", "16"))
@@ -2,12 +2,20 @@
 enrichers/base_enricher.py — Abstract base class for all enrichers.
 """
 
+import asyncio
+import logging
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
+
+log = logging.getLogger(__name__)
 
 
 class BaseEnricher(ABC):
 
+    # Column indices this enricher can fill. None = not declared (always run);
+    # an empty tuple marks a stub the pipeline can skip without dispatching.
+    COLUMNS: Optional[Tuple[int, ...]] = None
+
     @abstractmethod
     def enrich(self, ingredient_name: str) -> Dict[int, Any]:
         """
@@ -16,17 +24,58 @@ class BaseEnricher(ABC):
         """
         ...
 
-    def enrich_with_inci(self, ingredient_name: str, inci_name: str) -> Dict[int, Any]:
+    def enrich_with_inci(
+        self,
+        ingredient_name: str,
+        inci_name: str,
+        inci_lower: Optional[str] = None,
+    ) -> Dict[int, Any]:
         """
         Enrichers that need the INCI name for logic overrides this method.
         Default falls back to enrich() so existing enrichers work unchanged.
+        inci_lower is inci_name.lower(), computed once by the pipeline and
+        shared by every enricher's logic checks.
         """
         return self.enrich(ingredient_name)
 
+    async def enrich_async(
+        self,
+        ingredient_name: str,
+        inci_name: str,
+        inci_lower: Optional[str] = None,
+    ) -> Dict[int, Any]:
+        """
+        Async entry point used by the pipeline driver.
+        Default runs enrich_with_inci() in the loop's executor so blocking
+        scrapers don't hold up the other enrichers or ingredients.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, self.enrich_with_inci, ingredient_name, inci_name, inci_lower
+        )
+
+    def _log_failure(self, ingredient_name: str, error: BaseException) -> None:
+        # Traceback only when DEBUG is on; otherwise a one-line warning.
+        # The error's own traceback is used, so this also works outside the
+        # except block (e.g. for exceptions collected by asyncio.gather).
+        log.warning(
+            "[%s] Error on %r: %s",
+            type(self).__name__, ingredient_name, error,
+            exc_info=error if log.isEnabledFor(logging.DEBUG) else None,
+        )
+
     def safe_enrich(self, ingredient_name: str) -> Dict[int, Any]:
         """Wraps enrich() with error handling."""
         try:
             return self.enrich(ingredient_name)
         except Exception as e:
-            print(f"[{self.__class__.__name__}] Error on '{ingredient_name}': {e}")
+            self._log_failure(ingredient_name, e)
+            return {}
+
+    async def safe_enrich_async(self, ingredient_name: str) -> Dict[int, Any]:
+        """Wraps enrich_async() with the same error handling as safe_enrich()."""
+        try:
+            return await self.enrich_async(ingredient_name, ingredient_name)
+        except Exception as e:
+            self._log_failure(ingredient_name, e)
             return {}
\ No newline at end of file
@@ -13,6 +13,8 @@ from .base_enricher import BaseEnricher
 class ConcernEnricher(BaseEnricher):
     """Stub implementation — fills no columns yet."""
 
+    COLUMNS = ()
+
     def enrich(self, ingredient_name: str) -> Dict[int, Any]:
         # TODO: Implement concern mapping using rules + external knowledge.
         return {}
@@ -2,14 +2,16 @@
 enrichers/dietary_enricher.py
 Responsible for cols 37–54 (18 dietary/lifestyle flags).
 
-Priority per field:
+Priority per field (resolved in a single pass, logic first):
   1. Logic modules  — rule-based on INCI name, wins if it returns a value
   2. SkinSafe badge — used when logic has no opinion
 """
 
-from typing import Dict, Any
+import operator
+from typing import Dict, Any, Optional
 from .base_enricher import BaseEnricher
-from scrapers.skinsafe import scrape_skinsafe
+from scrapers.skinsafe import NOT_FOUND, scrape_skinsafe
+from logic._patterns import normalize
 from logic.paleo import is_paleo
 from logic.silicone import is_silicone_free
 from logic.latex import is_latex_free
@@ -40,8 +42,13 @@ _COL_MAP = {
     "dairy_free":     54,
 }
 
+# SkinSafe fields read in one C-level call → tuple, zipped with their columns
+_SS_FIELDS = tuple(_COL_MAP.keys())
+_SS_COLS   = tuple(_COL_MAP.values())
+_SS_GET    = operator.attrgetter(*_SS_FIELDS)
+
 # Logic functions mapped to their column index
-_LOGIC_MAP = [
+_LOGIC_MAP = (
     (37, is_vegetarian),   # Vegetarian
     (38, is_vegan),        # Vegan
     (40, is_paleo),        # Paleo
@@ -50,7 +57,11 @@ _LOGIC_MAP = [
     (48, is_sesame_free),  # Sesame-free
     (53, is_seafood_free), # Seafood-free
     (54, is_dairy_free),   # Dairy-free
-]
+)
+
+# Same map split into parallel tuples for the per-ingredient dispatch
+_LOGIC_COLS = tuple(col for col, _ in _LOGIC_MAP)
+_LOGIC_FNS  = tuple(fn for _, fn in _LOGIC_MAP)
 
 
 class DietaryEnricher(BaseEnricher):
@@ -58,20 +69,36 @@ class DietaryEnricher(BaseEnricher):
     def enrich(self, ingredient_name: str) -> Dict[int, Any]:
         return self.enrich_with_inci(ingredient_name, ingredient_name)
 
-    def enrich_with_inci(self, ingredient_name: str, inci_name: str) -> Dict[int, Any]:
-        result: Dict[int, Any] = {}
-
-        # ── Step 1: SkinSafe badges (baseline) ───────────────────────────────
-        ss = scrape_skinsafe(ingredient_name)
-        for field_name, col_idx in _COL_MAP.items():
-            value = getattr(ss, field_name, None)
-            if value is not None:
+    @staticmethod
+    def _fill_from_skinsafe(result: Dict[int, Any], ss) -> Dict[int, Any]:
+        """Add SkinSafe badge values for columns logic left undecided."""
+        if not ss.found:
+            # Unknown to SkinSafe — every badge is NOT_FOUND, no need to read them
+            for col_idx in _SS_COLS:
+                result.setdefault(col_idx, NOT_FOUND)
+            return result
+        for col_idx, value in zip(_SS_COLS, _SS_GET(ss)):
+            if value is not None and col_idx not in result:
                 result[col_idx] = value
+        return result
 
-        # ── Step 2: Logic overrides (INCI-based, always win) ─────────────────
-        for col_idx, logic_fn in _LOGIC_MAP:
-            verdict = logic_fn(inci_name)
-            if verdict is not None:
-                result[col_idx] = verdict
+    def enrich_with_inci(
+        self,
+        ingredient_name: str,
+        inci_name: str,
+        inci_lower: Optional[str] = None,
+    ) -> Dict[int, Any]:
+        # ── Step 1: Logic (INCI-based, always wins) ──────────────────────────
+        # Lowercased once, shared by every logic check below
+        lower = normalize(inci_name) if inci_lower is None else inci_lower
+        result: Dict[int, Any] = {
+            col_idx: verdict
+            for col_idx, verdict in zip(
+                _LOGIC_COLS, [fn(inci_name, lower=lower) for fn in _LOGIC_FNS]
+            )
+            if verdict is not None
+        }
 
-        return result
\ No newline at end of file
+        # ── Step 2: SkinSafe badges for the columns logic left open ──────────
+        # Logic covers only some SkinSafe columns, so there is always a scrape
+        return self._fill_from_skinsafe(result, scrape_skinsafe(ingredient_name))
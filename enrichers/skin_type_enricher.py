@@ -6,7 +6,7 @@ Responsible for cols 15–30:
   Acne-prone scale (6 levels)                — cols 25-30     TODO
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from .base_enricher import BaseEnricher
 from logic.sensitivity import get_sensitivity_ratings
 
@@ -16,14 +16,19 @@ class SkinTypeEnricher(BaseEnricher):
     def enrich(self, ingredient_name: str) -> Dict[int, Any]:
         return self.enrich_with_inci(ingredient_name, ingredient_name)
 
-    def enrich_with_inci(self, ingredient_name: str, inci_name: str) -> Dict[int, Any]:
+    def enrich_with_inci(
+        self,
+        ingredient_name: str,
+        inci_name: str,
+        inci_lower: Optional[str] = None,
+    ) -> Dict[int, Any]:
         result: Dict[int, Any] = {}
 
         # ── Sensitivity ratings (cols 19-24) ──────────────────────────────────
-        sensitivity = get_sensitivity_ratings(inci_name)
+        sensitivity = get_sensitivity_ratings(inci_name, lower=inci_lower)
         result.update(sensitivity)
 
         # TODO: skin type suitability (cols 15-18)
         # TODO: acne-prone suitability (cols 25-30)
 
-        return result
\ No newline at end of file
+        return result
@@ -8,7 +8,8 @@ Handles:
 """
 
 import csv
-from typing import List, Optional
+import itertools
+from typing import Iterator, List, Optional
 
 
 # Values in the first cell that indicate a non-data row to skip
@@ -21,20 +22,21 @@ def _looks_like_index_row(row: List[str]) -> bool:
     return numeric >= max(3, len(row) // 2)
 
 
-def read_csv(filepath: str, name_col: Optional[str] = "Ingredient name") -> List[str]:
+def iter_csv(filepath: str, name_col: Optional[str] = "Ingredient name") -> Iterator[str]:
     """
-    Read ingredient names from a CSV file.
+    Stream ingredient names from a CSV file, one row at a time.
+
+    Only the dialect-sniffing sample (4 KiB), the optional index row and the
+    header row are read up front; data rows are never held in memory.
 
     Args:
         filepath:  Path to the CSV file.
         name_col:  Name of the column containing ingredient names.
                    If None, uses the first column.
 
-    Returns:
-        List of ingredient name strings (stripped, non-empty).
+    Yields:
+        Ingredient name strings (stripped, non-empty).
     """
-    ingredients: List[str] = []
-
     with open(filepath, newline="", encoding="utf-8") as f:
         sample = f.read(4096)
         f.seek(0)
@@ -43,41 +45,52 @@ def read_csv(filepath: str, name_col: Optional[str] = "Ingredient name") -> List
         except csv.Error:
             dialect = csv.excel
 
-        all_rows = list(csv.reader(f, dialect=dialect))
-
-    if not all_rows:
-        return ingredients
-
-    # ── Detect and strip a leading numeric index row ──────────────────────────
-    start = 0
-    if _looks_like_index_row(all_rows[0]):
-        start = 1
-
-    if start >= len(all_rows):
-        return ingredients
-
-    header_row = all_rows[start]
-    data_rows  = all_rows[start + 1:]
-
-    # ── Resolve column index ──────────────────────────────────────────────────
-    col_idx = 0
-    if name_col:
-        stripped_header = [h.strip() for h in header_row]
-        if name_col in stripped_header:
-            col_idx = stripped_header.index(name_col)
-            # Header row is already consumed — don't add it to ingredients
-        else:
-            # No matching header found; treat header row as data if it's not a known label
-            first = header_row[0].strip().lower()
-            if first not in _SKIP_FIRST_CELL:
-                data_rows = [header_row] + data_rows
-
-    # ── Extract values ────────────────────────────────────────────────────────
-    for row in data_rows:
-        if col_idx >= len(row):
-            continue
-        val = row[col_idx].strip()
-        if val:
-            ingredients.append(val)
-
-    return ingredients
+        reader = csv.reader(f, dialect=dialect)
+
+        first_row = next(reader, None)
+        if first_row is None:
+            return
+
+        # ── Detect and strip a leading numeric index row ──────────────────────
+        header_row = first_row
+        if _looks_like_index_row(first_row):
+            header_row = next(reader, None)
+            if header_row is None:
+                return
+
+        # ── Resolve column index ──────────────────────────────────────────────
+        col_idx = 0
+        pending: List[List[str]] = []
+        if name_col:
+            stripped_header = [h.strip() for h in header_row]
+            if name_col in stripped_header:
+                col_idx = stripped_header.index(name_col)
+                # Header row is already consumed — don't add it to ingredients
+            else:
+                # No matching header found; treat header row as data if it's not a known label
+                first = header_row[0].strip().lower()
+                if first not in _SKIP_FIRST_CELL:
+                    pending.append(header_row)
+
+        # ── Extract values ────────────────────────────────────────────────────
+        for row in itertools.chain(pending, reader):
+            if col_idx >= len(row):
+                continue
+            val = row[col_idx].strip()
+            if val:
+                yield val
+
+
+def read_csv(filepath: str, name_col: Optional[str] = "Ingredient name") -> List[str]:
+    """
+    Read ingredient names from a CSV file.
+
+    Args:
+        filepath:  Path to the CSV file.
+        name_col:  Name of the column containing ingredient names.
+                   If None, uses the first column.
+
+    Returns:
+        List of ingredient name strings (stripped, non-empty).
+    """
+    return list(iter_csv(filepath, name_col=name_col))
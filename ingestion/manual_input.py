@@ -2,7 +2,7 @@
 ingestion/manual_input.py — Accept a list of ingredient names directly.
 """
 
-from typing import List
+from typing import Dict, List
 
 
 def read_manual(ingredients: List[str]) -> List[str]:
@@ -15,11 +15,9 @@ def read_manual(ingredients: List[str]) -> List[str]:
     Returns:
         Cleaned list (stripped, non-empty, deduplicated while preserving order).
     """
-    seen = set()
-    result: List[str] = []
-    for name in ingredients:
-        cleaned = str(name).strip()
-        if cleaned and cleaned.lower() not in seen:
-            seen.add(cleaned.lower())
-            result.append(cleaned)
-    return result
+    # Lowercased name → first-seen original; dicts keep insertion order
+    unique: Dict[str, str] = {}
+    for cleaned in map(str.strip, map(str, ingredients)):
+        if cleaned:
+            unique.setdefault(cleaned.lower(), cleaned)
+    return list(unique.values())
@@ -0,0 +1,139 @@
+"""
+logic/_patterns.py — Shared helpers for compiling term lists into matchers.
+
+Every logic module checks a lowercased INCI name against one or more lists
+of literal substrings. compile_terms() turns each list into a matcher that
+scans the name once:
+  - an Aho–Corasick automaton (pyahocorasick) when installed — one linear
+    pass regardless of how many terms the list holds
+  - otherwise a single regex alternation
+
+Both expose .search(text), truthy when any term occurs in text.
+
+compile_flags() does the same for several term lists at once, each tagged
+with a bit flag, and exposes .flags(text), the OR of the matching lists' flags.
+
+Matchers are built from the term lists at import. For lists of this size
+that takes well under a millisecond per module, so there is no prebuilt or
+pickled automaton to keep in sync with the source lists.
+"""
+
+import functools
+import operator
+import re
+import sys
+from typing import Dict, Iterable, Optional
+
+try:
+    import ahocorasick
+except ImportError:   # optional — regex fallback below
+    ahocorasick = None
+
+
+@functools.lru_cache(maxsize=16384)
+def normalize(inci_name: str) -> str:
+    """
+    Lowercased INCI name, as every term list expects. Memoised and interned,
+    so repeated names skip the casing pass and later cache lookups keyed on
+    the result compare by identity. Not stripped — terms such as "mel " rely
+    on surrounding whitespace.
+    """
+    return sys.intern(inci_name.lower())
+
+
+# Matches nothing; used for empty term lists (an empty alternation would match everything)
+_NEVER = re.compile(r"(?!)")
+
+
+class _Automaton:
+    """Aho–Corasick matcher with the same .search() contract as re.Pattern."""
+
+    __slots__ = ("_ac",)
+
+    def __init__(self, terms: Iterable[str]):
+        self._ac = ahocorasick.Automaton()
+        for term in terms:
+            self._ac.add_word(term, term)
+        self._ac.make_automaton()
+
+    def search(self, text: str) -> Optional[str]:
+        """Return the first term found in text, or None."""
+        for _, term in self._ac.iter(text):
+            return term
+        return None
+
+
+def compile_alternation(terms: Iterable[str]) -> "re.Pattern[str]":
+    """
+    Compile literal terms into one regex alternation.
+
+    Longer terms are tried first so that, where two terms overlap at the same
+    position, the longer one wins (matters for substitution, not for search).
+    """
+    ordered = sorted(set(terms), key=len, reverse=True)
+    if not ordered:
+        return _NEVER
+    return re.compile("|".join(re.escape(t) for t in ordered))
+
+
+def compile_terms(terms: Iterable[str]):
+    """Compile literal terms into the fastest available substring matcher."""
+    terms = [t for t in terms if t]
+    if ahocorasick is not None and terms:
+        return _Automaton(terms)
+    return compile_alternation(terms)
+
+
+class _FlagAutomaton:
+    """One Aho–Corasick pass OR-ing together the flags of every matched term."""
+
+    __slots__ = ("_ac", "_all")
+
+    def __init__(self, flagged: Dict[int, Iterable[str]]):
+        term_flags: Dict[str, int] = {}
+        for flag, terms in flagged.items():
+            for term in terms:
+                if term:
+                    term_flags[term] = term_flags.get(term, 0) | flag
+
+        self._ac = ahocorasick.Automaton()
+        for term, flags in term_flags.items():
+            self._ac.add_word(term, flags)
+        self._ac.make_automaton()
+        self._all = functools.reduce(operator.or_, flagged, 0)
+
+    def flags(self, text: str) -> int:
+        found = 0
+        # iter() reports overlapping matches too ("urea" inside "diazolidinyl urea")
+        for _, term_flags in self._ac.iter(text):
+            found |= term_flags
+            if found == self._all:
+                break
+        return found
+
+
+class _FlagRegexes:
+    """Fallback: one alternation per term list."""
+
+    __slots__ = ("_patterns",)
+
+    def __init__(self, flagged: Dict[int, Iterable[str]]):
+        self._patterns = [(flag, compile_alternation(terms)) for flag, terms in flagged.items()]
+
+    def flags(self, text: str) -> int:
+        found = 0
+        for flag, pattern in self._patterns:
+            if pattern.search(text):
+                found |= flag
+        return found
+
+
+def compile_flags(flagged: Dict[int, Iterable[str]]):
+    """
+    Compile {bit_flag: terms} into a matcher whose .flags(text) returns the
+    OR of the flags of every list with at least one match in text.
+    """
+    flagged = {flag: list(terms) for flag, terms in flagged.items()}
+    if ahocorasick is not None and any(any(terms) for terms in flagged.values()):
+        return _FlagAutomaton(flagged)
+    return _FlagRegexes(flagged)
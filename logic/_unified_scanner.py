@@ -0,0 +1,56 @@
+"""
+logic/_unified_scanner.py — One scan per INCI name shared by several classifiers.
+
+The sensitivity, vegan and vegetarian term lists overlap heavily and are all
+checked against the same lowercased name. scan() runs every list through a
+single flag matcher (see logic._patterns.compile_flags) and memoises the
+resulting bitmask per name, so whichever classifier asks first pays for the
+pass and the others read their bits from the cache.
+
+Only plain term lists live here; rules with their own pre-processing
+(false-positive stripping in dairy/seafood, silicone, regex patterns) stay
+in their modules.
+"""
+
+from functools import lru_cache
+
+from logic._patterns import compile_flags
+
+# ── Flags ─────────────────────────────────────────────────────────────────────
+# Sensitivity categories A–F (logic/sensitivity.py)
+SENS_A, SENS_B, SENS_C, SENS_D, SENS_E, SENS_F = 1, 2, 4, 8, 16, 32
+SENS_ALL = SENS_A | SENS_B | SENS_C | SENS_D | SENS_E | SENS_F
+
+NON_VEGAN      = 1 << 6    # logic/vegan.py "No" lists
+ALWAYS_VEGAN   = 1 << 7    # logic/vegan.py "Yes" list
+NON_VEGETARIAN = 1 << 8    # logic/vegetarian.py "No" lists
+VEGETARIAN_YES = 1 << 9    # logic/vegetarian.py "Yes" list
+
+_matcher = None
+
+
+def _build():
+    # Imported here: those modules import scan() from this one
+    from logic import sensitivity, vegan, vegetarian
+
+    return compile_flags({
+        SENS_A:         sensitivity._CAT_A,
+        SENS_B:         sensitivity._CAT_B,
+        SENS_C:         sensitivity._CAT_C,
+        SENS_D:         sensitivity._CAT_D,
+        SENS_E:         sensitivity._CAT_E,
+        SENS_F:         sensitivity._CAT_F,
+        NON_VEGAN:      vegan._NON_VEGAN_TERMS,
+        ALWAYS_VEGAN:   vegan._ALWAYS_VEGAN,
+        NON_VEGETARIAN: vegetarian._NON_VEGETARIAN_TERMS,
+        VEGETARIAN_YES: vegetarian._VEGETARIAN_YES,
+    })
+
+
+@lru_cache(maxsize=8192)
+def scan(lower: str) -> int:
+    """Return the OR of the flags of every term list matching a lowercased name."""
+    global _matcher
+    if _matcher is None:
+        _matcher = _build()
+    return _matcher.flags(lower)
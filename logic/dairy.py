@@ -9,6 +9,10 @@ Note: lactic acid, sodium lactate, lactate, lactylate are fermentation-derived
 and do NOT trigger dairy flag.
 """
 
+from functools import lru_cache
+
+from logic._patterns import compile_alternation, compile_terms, normalize
+
 _CONTAINS = [
     "milk",
     " lac ",         # space-padded to avoid "lactic", "lactate", "black", etc.
@@ -54,21 +58,27 @@ _FALSE_POSITIVES = [
     "lactose",      # lactose itself is ambiguous but listed as dairy-free safe
 ]
 
+_CONTAINS_RE       = compile_terms(_CONTAINS)
+_FALSE_POSITIVE_RE = compile_alternation(_FALSE_POSITIVES)
+
 
-def is_dairy_free(inci_name: str) -> str | None:
+def is_dairy_free(inci_name: str, lower: str | None = None) -> str | None:
     if not inci_name:
         return None
 
-    lower = inci_name.lower()
+    if lower is None:
+        lower = normalize(inci_name)
+
+    return _is_dairy_free(lower)
+
 
-    # Remove false positives before checking
-    clean = lower
-    for fp in _FALSE_POSITIVES:
-        clean = clean.replace(fp, "")
+@lru_cache(maxsize=8192)
+def _is_dairy_free(lower: str) -> str | None:
+    # Remove false positives before checking (one pass, one allocation)
+    clean = _FALSE_POSITIVE_RE.sub("", lower)
 
-    for term in _CONTAINS:
-        if term in clean:
-            return "No"
+    if _CONTAINS_RE.search(clean):
+        return "No"
 
     return None
 
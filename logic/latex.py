@@ -6,6 +6,10 @@ Returns:
   None  — no latex detected
 """
 
+from functools import lru_cache
+
+from logic._patterns import compile_terms, normalize
+
 # ── 1. True latex sources ─────────────────────────────────────────────────────
 _CONTAINS = [
     "latex",
@@ -35,20 +39,27 @@ _CROSS_REACTIVE_STEMS = [
     "papain",
 ]
 
+_CONTAINS_RE       = compile_terms(_CONTAINS)
+_CROSS_REACTIVE_RE = compile_terms(_CROSS_REACTIVE_STEMS)
+
 
-def is_latex_free(inci_name: str) -> str | None:
+def is_latex_free(inci_name: str, lower: str | None = None) -> str | None:
     if not inci_name:
         return None
 
-    lower = inci_name.lower()
+    if lower is None:
+        lower = normalize(inci_name)
+
+    return _is_latex_free(lower)
+
 
-    for term in _CONTAINS:
-        if term in lower:
-            return "No"
+@lru_cache(maxsize=8192)
+def _is_latex_free(lower: str) -> str | None:
+    if _CONTAINS_RE.search(lower):
+        return "No"
 
-    for stem in _CROSS_REACTIVE_STEMS:
-        if stem in lower:
-            return "No"
+    if _CROSS_REACTIVE_RE.search(lower):
+        return "No"
 
     return None
 
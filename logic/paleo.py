@@ -7,6 +7,9 @@ Returns:
 """
 
 import re
+from functools import lru_cache
+
+from logic._patterns import compile_alternation, normalize
 
 # ── Rule sets (all checks are case-insensitive) ───────────────────────────────
 
@@ -38,17 +41,22 @@ _CONTAINS_NOT_PALEO = [
     "aroma",
 ]
 
-# Ends in or contains "-eth" (Laureth, Ceteareth, Oleth, etc.)
-# Matches: -eth, eth- (prefix), or any word ending in "eth" (laurETH, cetearETH)
-_ETH_PATTERN = re.compile(r'-eth\b|\beth-|\w+eth\b', re.IGNORECASE)
+# 2. Ends in or contains "-eth" (Laureth, Ceteareth, Oleth, etc.)
+# Matches: -eth, eth- (prefix), or any word ending in "eth" (laurETH, cetearETH).
+# \Beth\b is "\w+eth\b" without the backtracking: "eth" preceded by a word char.
+_ETH = r"-eth\b|\beth-|\Beth\b"
+
+# Both rule sets in one pattern, so each (lowercased) name is scanned once
+_NOT_PALEO_RE = re.compile(_ETH + "|" + compile_alternation(_CONTAINS_NOT_PALEO).pattern)
 
 
-def is_paleo(inci_name: str) -> str | None:
+def is_paleo(inci_name: str, lower: str | None = None) -> str | None:
     """
     Evaluate Paleo status from the INCI name.
 
     Args:
         inci_name: The INCI name string (e.g. "SODIUM LAURETH SULFATE")
+        lower:     inci_name.lower(), if the caller already has it
 
     Returns:
         "No"  if any NOT-Paleo rule fires
@@ -57,15 +65,16 @@ def is_paleo(inci_name: str) -> str | None:
     if not inci_name:
         return None
 
-    lower = inci_name.lower()
+    if lower is None:
+        lower = normalize(inci_name)
+
+    return _is_paleo(lower)
 
-    # Substring checks
-    for term in _CONTAINS_NOT_PALEO:
-        if term in lower:
-            return "No"
 
-    # -eth pattern (Laureth, Ceteareth, Steareth, Oleth, etc.)
-    if _ETH_PATTERN.search(inci_name):
+@lru_cache(maxsize=8192)
+def _is_paleo(lower: str) -> str | None:
+    # Substring checks and -eth pattern (Laureth, Ceteareth, Steareth, Oleth, etc.)
+    if _NOT_PALEO_RE.search(lower):
         return "No"
 
     return None
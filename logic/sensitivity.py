@@ -169,6 +169,17 @@ _CAT_F = [
 
 # ── Additional pattern checks ─────────────────────────────────────────────────
 import re
+from functools import lru_cache
+
+from logic._patterns import normalize
+
+# Category bit flags. The six lists are matched by the unified scanner in the
+# same pass as the vegan/vegetarian lists (logic/_unified_scanner.py)
+from logic._unified_scanner import (
+    SENS_A as _A, SENS_B as _B, SENS_C as _C,
+    SENS_D as _D, SENS_E as _E, SENS_F as _F,
+    SENS_ALL, scan,
+)
 
 # Citrus + peel oil pattern
 _CITRUS_PEEL_PATTERN = re.compile(
@@ -178,80 +189,57 @@ _CITRUS_PEEL_PATTERN = re.compile(
 _MENTHA_PATTERN = re.compile(r'mentha.*oil', re.IGNORECASE)
 
 
-def _get_categories(inci_name: str) -> set:
-    """Return the set of irritant categories this ingredient belongs to."""
-    if not inci_name:
-        return set()
-
-    lower = inci_name.lower()
-    cats = set()
-
-    for term in _CAT_A:
-        if term in lower:
-            cats.add("A")
-            break
-
-    for term in _CAT_B:
-        if term in lower:
-            cats.add("B")
-            break
-    if not "B" in cats:
-        if _CITRUS_PEEL_PATTERN.search(inci_name):
-            cats.add("B")
-        elif _MENTHA_PATTERN.search(inci_name):
-            cats.add("B")
+def _get_categories(lower: str) -> int:
+    """Return the irritant categories (OR of _A.._F) for a lowercased INCI name."""
+    if not lower:
+        return 0
 
-    for term in _CAT_C:
-        if term in lower:
-            cats.add("C")
-            break
+    cats = scan(lower) & SENS_ALL
 
-    for term in _CAT_D:
-        if term in lower:
-            cats.add("D")
-            break
-
-    for term in _CAT_E:
-        if term in lower:
-            cats.add("E")
-            break
-
-    for term in _CAT_F:
-        if term in lower:
-            cats.add("F")
-            break
+    if not cats & _B:
+        if _CITRUS_PEEL_PATTERN.search(lower) or _MENTHA_PATTERN.search(lower):
+            cats |= _B
 
     return cats
 
 
 # ── Exclusion rules per sensitivity level ────────────────────────────────────
 _EXCLUSIONS = {
-    19: set(),                          # Not sensitive        — no exclusions
-    20: {"A", "F"},                     # A little sensitive
-    21: {"A", "C", "F"},                # Moderately sensitive
-    22: {"A", "C", "E", "F"},           # Sensitive
-    23: {"A", "C", "D", "E", "F"},      # Very sensitive
-    24: {"A", "B", "C", "D", "E", "F"}, # Extremely sensitive
+    19: 0,                              # Not sensitive        — no exclusions
+    20: _A | _F,                        # A little sensitive
+    21: _A | _C | _F,                   # Moderately sensitive
+    22: _A | _C | _E | _F,              # Sensitive
+    23: _A | _C | _D | _E | _F,         # Very sensitive
+    24: _A | _B | _C | _D | _E | _F,    # Extremely sensitive
 }
 
 
-def get_sensitivity_ratings(inci_name: str) -> dict:
+def get_sensitivity_ratings(inci_name: str, lower: str | None = None) -> dict:
     """
     Returns a dict of {col_index: "Yes"/"No"} for cols 19-24.
     Only returns values when the ingredient is in a known category.
     If the ingredient has no irritant categories, returns empty dict
     (SkinSafe or other sources will fill in).
+    lower may be passed in when the caller already has inci_name.lower().
     """
-    cats = _get_categories(inci_name)
+    if not inci_name:
+        return {}
+    if lower is None:
+        lower = normalize(inci_name)
+    # Fresh dict per call — the cached ratings are shared
+    return dict(_ratings(lower))
 
-    if not cats:
-        return {}   # No opinion — defer to other sources
 
-    result = {}
-    for col_idx, excluded_cats in _EXCLUSIONS.items():
-        if cats & excluded_cats:
-            result[col_idx] = "No"   # At least one of its categories is excluded
-        else:
-            result[col_idx] = "Yes"  # All its categories are allowed
+@lru_cache(maxsize=8192)
+def _ratings(lower: str) -> tuple:
+    """Ratings as ((col_index, verdict), ...), memoised per lowercased name."""
+    cats = _get_categories(lower)
+
+    if not cats:
+        return ()   # No opinion — defer to other sources
 
-    return result
+    # "No" when at least one of its categories is excluded, else "Yes"
+    return tuple(
+        (col_idx, "No" if cats & excluded else "Yes")
+        for col_idx, excluded in _EXCLUSIONS.items()
+    )
@@ -6,21 +6,32 @@ Returns:
   None  — no sesame detected
 """
 
+from functools import lru_cache
+
+from logic._patterns import compile_terms, normalize
+
 _CONTAINS = [
     "sesamum",
     "sesame",
 ]
 
+_CONTAINS_RE = compile_terms(_CONTAINS)
+
 
-def is_sesame_free(inci_name: str) -> str | None:
+def is_sesame_free(inci_name: str, lower: str | None = None) -> str | None:
     if not inci_name:
         return None
 
-    lower = inci_name.lower()
+    if lower is None:
+        lower = normalize(inci_name)
+
+    return _is_sesame_free(lower)
+
 
-    for term in _CONTAINS:
-        if term in lower:
-            return "No"
+@lru_cache(maxsize=8192)
+def _is_sesame_free(lower: str) -> str | None:
+    if _CONTAINS_RE.search(lower):
+        return "No"
 
     return None
 
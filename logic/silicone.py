@@ -8,7 +8,9 @@ Returns:
 Key distinction: silica/silicate are NOT silicones → never flagged.
 """
 
-import re
+from functools import lru_cache
+
+from logic._patterns import compile_alternation, compile_terms, normalize
 
 # ── 1. Obvious silicone keywords ──────────────────────────────────────────────
 _CONTAINS = [
@@ -28,16 +30,20 @@ _CONTAINS = [
     "silsesquioxane",
 ]
 
+_CONTAINS_RE = compile_terms(_CONTAINS)
+
 # ── 2. Silane stem (triethoxycaprylylsilane, etc.) ────────────────────────────
-# Match "silan" as a word stem but NOT "silica" or "silicate"
-_SILANE_PATTERN = re.compile(r'silan(?!e\s*$)', re.IGNORECASE)  # catches silane, silanol, etc.
-# Actually simpler: match "silan" anywhere that isn't preceded by "sili" (silica/silicate)
-_SILANE_PATTERN = re.compile(r'(?<!sili)silan', re.IGNORECASE)
+# "silan" anywhere catches silane, silanol, etc. Neither "silica" nor
+# "silicate" contains it, so a plain substring test is enough.
+_SILANE_STEM = "silan"
 
 # ── 3. Silicone root + crosspolymer/polymer combo ─────────────────────────────
 _SILICONE_ROOTS = ["dimethicone", "siloxane", "methicone"]
 _POLYMER_TERMS  = ["crosspolymer", "polymer"]
 
+_SILICONE_ROOTS_RE = compile_terms(_SILICONE_ROOTS)
+_POLYMER_TERMS_RE  = compile_terms(_POLYMER_TERMS)
+
 # ── 4. Terms that look like silicone but are NOT ──────────────────────────────
 _FALSE_POSITIVES = [
     "silica",
@@ -45,8 +51,10 @@ _FALSE_POSITIVES = [
     "silicon dioxide",
 ]
 
+_FALSE_POSITIVE_RE = compile_alternation(_FALSE_POSITIVES)
+
 
-def is_silicone_free(inci_name: str) -> str | None:
+def is_silicone_free(inci_name: str, lower: str | None = None) -> str | None:
     """
     Evaluate Silicone-free status from the INCI name.
 
@@ -57,27 +65,28 @@ def is_silicone_free(inci_name: str) -> str | None:
     if not inci_name:
         return None
 
-    lower = inci_name.lower()
+    if lower is None:
+        lower = normalize(inci_name)
 
+    return _is_silicone_free(lower)
+
+
+@lru_cache(maxsize=8192)
+def _is_silicone_free(lower: str) -> str | None:
     # ── Guard: strip known false positives before checking ───────────────────
-    # Replace silica/silicate with a placeholder so they don't trigger checks
-    clean = lower
-    for fp in _FALSE_POSITIVES:
-        clean = clean.replace(fp, "")
+    # Remove silica/silicate so they don't trigger checks
+    clean = _FALSE_POSITIVE_RE.sub("", lower)
 
     # ── 1 & 2 & 3 & 5 & 6: simple substring checks ───────────────────────────
-    for term in _CONTAINS:
-        if term in clean:
-            return "No"
+    if _CONTAINS_RE.search(clean):
+        return "No"
 
     # ── Silane stem ───────────────────────────────────────────────────────────
-    if _SILANE_PATTERN.search(clean):
+    if _SILANE_STEM in clean:
         return "No"
 
     # ── 4. Silicone root + crosspolymer/polymer combo ─────────────────────────
-    has_root    = any(root in clean for root in _SILICONE_ROOTS)
-    has_polymer = any(poly in clean for poly in _POLYMER_TERMS)
-    if has_root and has_polymer:
+    if _SILICONE_ROOTS_RE.search(clean) and _POLYMER_TERMS_RE.search(clean):
         return "No"
 
     return None
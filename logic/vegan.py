@@ -17,8 +17,12 @@ Logic:
     7. Contains other slaughter-derived ingredients (tallow, lard, gelatin, etc.)
 """
 
+from functools import lru_cache
+
 from logic.seafood import is_seafood_free
 from logic.dairy import is_dairy_free
+from logic._patterns import normalize
+from logic._unified_scanner import ALWAYS_VEGAN, NON_VEGAN, scan
 
 # ── Bee-derived ───────────────────────────────────────────────────────────────
 _BEE_TERMS = [
@@ -79,44 +83,41 @@ _ALWAYS_VEGAN = [
     "bentonite", "silica",
 ]
 
+# Every non-vegan list gives the same verdict, so they share one flag in
+# the unified scanner (logic/_unified_scanner.py), as does _ALWAYS_VEGAN
+_NON_VEGAN_TERMS = (
+    _BEE_TERMS + _LANOLIN_TERMS + _ANIMAL_PROTEIN_TERMS + _CARMINE_TERMS + _SLAUGHTER_TERMS
+)
+
 
-def is_vegan(inci_name: str) -> str | None:
+def is_vegan(inci_name: str, lower: str | None = None) -> str | None:
     if not inci_name:
         return None
 
-    lower = inci_name.lower()
+    if lower is None:
+        lower = normalize(inci_name)
+
+    return _is_vegan(lower)
+
 
+@lru_cache(maxsize=8192)
+def _is_vegan(lower: str) -> str | None:
     # ── Check non-vegan triggers ──────────────────────────────────────────────
-    if is_seafood_free(inci_name) == "No":
+    if is_seafood_free(lower, lower) == "No":
         return "No"
 
-    if is_dairy_free(inci_name) == "No":
+    if is_dairy_free(lower, lower) == "No":
         return "No"
 
-    for term in _BEE_TERMS:
-        if term in lower:
-            return "No"
+    flags = scan(lower)
 
-    for term in _LANOLIN_TERMS:
-        if term in lower:
-            return "No"
-
-    for term in _ANIMAL_PROTEIN_TERMS:
-        if term in lower:
-            return "No"
-
-    for term in _CARMINE_TERMS:
-        if term in lower:
-            return "No"
-
-    for term in _SLAUGHTER_TERMS:
-        if term in lower:
-            return "No"
+    # Bee, lanolin, animal protein, carmine, slaughter-derived
+    if flags & NON_VEGAN:
+        return "No"
 
     # ── Check confirmed vegan ─────────────────────────────────────────────────
-    for term in _ALWAYS_VEGAN:
-        if term in lower:
-            return "Yes"
+    if flags & ALWAYS_VEGAN:
+        return "Yes"
 
     return None
 
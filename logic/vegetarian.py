@@ -12,7 +12,11 @@ Logic:
   Dairy, eggs, bee products, and lanolin are vegetarian-acceptable.
 """
 
+from functools import lru_cache
+
 from logic.seafood import is_seafood_free
+from logic._patterns import normalize
+from logic._unified_scanner import NON_VEGETARIAN, VEGETARIAN_YES, scan
 
 # ── Confirmed vegetarian (not vegan but vegetarian-acceptable) ────────────────
 _VEGETARIAN_YES = [
@@ -70,37 +74,38 @@ _OTHER_ANIMAL_TERMS = [
     "sponge",
 ]
 
+# Every non-vegetarian list gives the same verdict, so they share one flag in
+# the unified scanner (logic/_unified_scanner.py), as does _VEGETARIAN_YES
+_NON_VEGETARIAN_TERMS = (
+    _SLAUGHTER_TERMS + _INSECT_TERMS + _SILK_TERMS + _OTHER_ANIMAL_TERMS
+)
+
 
-def is_vegetarian(inci_name: str) -> str | None:
+def is_vegetarian(inci_name: str, lower: str | None = None) -> str | None:
     if not inci_name:
         return None
 
-    lower = inci_name.lower()
+    if lower is None:
+        lower = normalize(inci_name)
 
-    # Fish and shellfish = non-vegetarian
-    if is_seafood_free(inci_name) == "No":
-        return "No"
+    return _is_vegetarian(lower)
 
-    for term in _SLAUGHTER_TERMS:
-        if term in lower:
-            return "No"
 
-    for term in _INSECT_TERMS:
-        if term in lower:
-            return "No"
+@lru_cache(maxsize=8192)
+def _is_vegetarian(lower: str) -> str | None:
+    # Fish and shellfish = non-vegetarian
+    if is_seafood_free(lower, lower) == "No":
+        return "No"
 
-    for term in _SILK_TERMS:
-        if term in lower:
-            return "No"
+    flags = scan(lower)
 
-    for term in _OTHER_ANIMAL_TERMS:
-        if term in lower:
-            return "No"
+    # Slaughter-derived, insect, silk, pearl/coral/sponge
+    if flags & NON_VEGETARIAN:
+        return "No"
 
     # Confirmed vegetarian-acceptable
-    for term in _VEGETARIAN_YES:
-        if term in lower:
-            return "Yes"
+    if flags & VEGETARIAN_YES:
+        return "Yes"
 
     return None
 
@@ -13,13 +13,21 @@ Usage examples:
 
   # Custom output path
   python main.py --csv input.csv --output results/my_output.csv
+
+  # Large inputs: spread the work over several processes
+  python main.py --csv input.csv --processes 4
 """
 
 import argparse
+import asyncio
+import logging
+import logging.handlers
+import multiprocessing
 import os
 import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Dict, Any
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 # ── Ingestion ─────────────────────────────────────────────────────────────────
 from ingestion.csv_reader    import read_csv
@@ -35,8 +43,15 @@ from enrichers.dietary_enricher   import DietaryEnricher
 from enrichers.concern_enricher   import ConcernEnricher
 from enrichers.benefits_enricher  import BenefitsEnricher
 
+# ── Logic ─────────────────────────────────────────────────────────────────────
+from logic._patterns import normalize
+
 # ── Output ────────────────────────────────────────────────────────────────────
-from output.csv_writer import write_csv, build_record
+from output.csv_writer import CsvStreamWriter, format_record
+
+# ── Scrape cache ──────────────────────────────────────────────────────────────
+from scrapers._cache import is_force_rescrape, set_force_rescrape
+from scrapers._throttle import LIMITER
 
 # ── Config ────────────────────────────────────────────────────────────────────
 from config import DEFAULT_OUTPUT_DIR, DEFAULT_OUTPUT_FILE, MAX_WORKERS
@@ -55,63 +70,236 @@ ENRICHERS = [
     BenefitsEnricher(),
 ]
 
+# Stubs that declare no columns would only cost an executor hop per ingredient
+_ACTIVE_ENRICHERS = [e for e in ENRICHERS if e.COLUMNS != ()]
 
-def process_ingredient(ingredient_name: str) -> Dict[int, Any]:
+
+async def process_ingredient_async(ingredient_name: str) -> Dict[int, Any]:
     """
     Run the full pipeline for one ingredient:
       1. IdentityEnricher first → scrapes INCI name from CosIng
-      2. All other enrichers    → receive inci_name so logic modules can use it
+      2. All other enrichers    → run concurrently, receive inci_name so
+                                  logic modules can use it
     """
-    merged: Dict[int, Any] = {}
+    # Enrichers key their output by column index, so their columns are written
+    # straight into this one record — no build_record() pass over a copy.
+    record: Dict[int, Any] = {}
 
     # Step 1: identity (must run first to get INCI name)
-    identity = IDENTITY_ENRICHER.safe_enrich(ingredient_name)
-    merged.update(identity)
-    inci_name = merged.get(1) or ingredient_name   # col 1 = INCI Name
+    identity = await IDENTITY_ENRICHER.safe_enrich_async(ingredient_name)
+    record.update(identity)
+    inci_name = record.get(1) or ingredient_name   # col 1 = INCI Name
+    inci_lower = normalize(inci_name)              # shared by all logic checks
+
+    # Step 2: remaining enrichers with inci_name context.
+    # Results are merged in ENRICHERS order, so overlapping columns resolve
+    # exactly as they did when the enrichers ran one after another.
+    partials = await asyncio.gather(
+        *(enricher.enrich_async(ingredient_name, inci_name, inci_lower)
+          for enricher in _ACTIVE_ENRICHERS),
+        return_exceptions=True,
+    )
+    for enricher, partial in zip(_ACTIVE_ENRICHERS, partials):
+        # return_exceptions=True also hands back CancelledError (a BaseException)
+        if isinstance(partial, BaseException):
+            enricher._log_failure(ingredient_name, partial)
+            continue
+        record.update(partial)
+
+    return record
 
-    # Step 2: remaining enrichers with inci_name context
-    for enricher in ENRICHERS:
+
+def process_ingredient(ingredient_name: str) -> Dict[int, Any]:
+    """Synchronous wrapper around process_ingredient_async()."""
+    return asyncio.run(process_ingredient_async(ingredient_name))
+
+
+async def _run_pipeline_async(
+    ingredients: List[str],
+    workers: int,
+    on_record: Callable[[int, Dict[int, Any]], None],
+) -> None:
+    """
+    Process all ingredients on one event loop. Blocking enricher work runs on
+    a pool of `workers` threads; at most `workers` ingredients are in flight.
+    on_record(idx, record) is called as each ingredient finishes, in
+    completion order.
+    """
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=workers))
+    slots = asyncio.Semaphore(workers)
+
+    async def _one(idx: int, ingredient: str) -> None:
+        async with slots:
             try:
-                partial = enricher.enrich_with_inci(ingredient_name, inci_name)
+                record = await process_ingredient_async(ingredient)
+                print(f"  ✓ {ingredient}")
             except Exception as e:
-                print(f"[{enricher.__class__.__name__}] failed: {e}")
-                partial = {}
-            merged.update(partial)
+                print(f"  ✗ {ingredient}: {e}")
+                record = {0: ingredient}   # col 0 = Ingredient name
+        on_record(idx, record)
+
+    await asyncio.gather(*(_one(i, name) for i, name in enumerate(ingredients)))
+
+
+class _InputOrderWriter:
+    """
+    Streams records (or lines already produced by format_record) to a
+    CsvStreamWriter in input-row order while they complete in any order.
+
+    order[row] is the index of the unique ingredient each input row shows;
+    a formatted line is held only until its last row has been written.
+    """
+
+    def __init__(self, out: CsvStreamWriter, order: List[int]):
+        self._out = out
+        self._order = order
+        self._last_row = {u: row for row, u in enumerate(order)}
+        self._lines: Dict[int, str] = {}
+        self._next_row = 0
+
+    def add(self, u: int, record: Dict[int, Any]) -> None:
+        self.add_line(u, format_record(record))
+
+    def add_line(self, u: int, line: str) -> None:
+        order, lines = self._order, self._lines
+        lines[u] = line
+        while self._next_row < len(order) and order[self._next_row] in lines:
+            row_u = order[self._next_row]
+            self._out.write_line(lines[row_u])
+            if self._last_row[row_u] == self._next_row:
+                del lines[row_u]
+            self._next_row += 1
+
+
+# ── Logging ───────────────────────────────────────────────────────────────────
+# Records are only put on a queue by the thread (or process) that logs them;
+# one listener thread in the CLI process formats and writes them, so worker
+# threads and the event loop never wait on stderr.
+
+_log_config: Optional[Tuple[Any, bool]] = None   # (queue, verbose), set by main()
+_PROJECT_LOGGERS = ("__main__", "main", "enrichers", "ingestion", "logic", "output", "scrapers")
+
+
+def _configure_logging(log_queue, verbose: bool) -> None:
+    """Send every record to log_queue, at the level the CLI asked for."""
+    global _log_config
+    _log_config = (log_queue, verbose)
+
+    root = logging.getLogger()
+    root.handlers[:] = [logging.handlers.QueueHandler(log_queue)]
+    # Third-party libraries (asyncio, urllib3, ...) stay at WARNING even
+    # with --verbose; only this project's loggers go down to DEBUG
+    root.setLevel(logging.WARNING)
+    if verbose:
+        for name in _PROJECT_LOGGERS:
+            logging.getLogger(name).setLevel(logging.DEBUG)
+    else:
+        # Batch scrape progress is logged at INFO; show it without --verbose,
+        # which is what also turns on DEBUG tracebacks
+        logging.getLogger("scrapers").setLevel(logging.INFO)
 
-    return build_record(merged)
+
+def _start_log_listener(verbose: bool) -> logging.handlers.QueueListener:
+    # A multiprocessing queue, so --processes workers can log through it too
+    log_queue = multiprocessing.Queue()
+    _configure_logging(log_queue, verbose)
+
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    listener.start()
+    return listener
+
+
+# ── Multi-process mode ────────────────────────────────────────────────────────
+
+def _init_worker(
+    force_rescrape: bool,
+    processes: int,
+    log_config: Optional[Tuple[Any, bool]],
+) -> None:
+    """ProcessPoolExecutor initializer: carry CLI state into the worker."""
+    set_force_rescrape(force_rescrape)
+    if log_config is not None:
+        _configure_logging(*log_config)
+    # Each process has its own limiter — split the per-domain budget so the
+    # sites see the same total load as with a single process
+    LIMITER.share(processes)
+
+
+def _run_chunk(chunk: List[str], workers: int) -> List[str]:
+    """
+    Run one chunk and return its CSV lines. Formatting here rather than in
+    the parent keeps it off the writer's core and sends one short string per
+    record back over the pipe instead of a pickled 94-entry dict.
+    """
+    lines: List[str] = [""] * len(chunk)
+
+    def _on_record(idx: int, record: Dict[int, Any]) -> None:
+        lines[idx] = format_record(record)
+
+    asyncio.run(_run_pipeline_async(chunk, workers, _on_record))
+    return lines
+
+
+def _iter_in_processes(
+    ingredients: List[str],
+    workers: int,
+    processes: int,
+) -> Iterator[str]:
+    """
+    Split ingredients into chunks and run each chunk's async pipeline in a
+    worker process, so the CPU-bound logic work runs on several cores.
+    Yields formatted CSV lines in input order.
+    Scrape results are shared between processes through the disk cache only.
+    """
+    size = max(1, len(ingredients) // (processes * 4))
+    chunks = [ingredients[i:i + size] for i in range(0, len(ingredients), size)]
+
+    with ProcessPoolExecutor(
+        max_workers=processes,
+        initializer=_init_worker,
+        initargs=(is_force_rescrape(), processes, _log_config),
+    ) as pool:
+        # map() yields chunks in order as they finish, so records stream out
+        for chunk_lines in pool.map(_run_chunk, chunks, repeat(workers)):
+            yield from chunk_lines
 
 
 def run_pipeline(
     ingredients: List[str],
     output_path: str,
     workers: int = MAX_WORKERS,
+    processes: int = 1,
 ) -> str:
     if not ingredients:
         print("No ingredients to process.")
         return ""
 
-    print(f"Processing {len(ingredients)} ingredient(s) with {workers} worker(s)...")
+    # Each distinct name is processed once; repeats reuse its record
+    unique = list(dict.fromkeys(ingredients))
+    if len(unique) < len(ingredients):
+        print(f"{len(ingredients) - len(unique)} duplicate row(s) will reuse earlier results.")
 
-    records: List[Dict[int, Any]] = [None] * len(ingredients)
+    unique_idx = {name: u for u, name in enumerate(unique)}
 
-    with ThreadPoolExecutor(max_workers=workers) as executor:
-        future_to_idx = {
-            executor.submit(process_ingredient, name): i
-            for i, name in enumerate(ingredients)
-        }
-        for future in as_completed(future_to_idx):
-            idx = future_to_idx[future]
-            ingredient = ingredients[idx]
-            try:
-                records[idx] = future.result()
-                print(f"  ✓ {ingredient}")
-            except Exception as e:
-                print(f"  ✗ {ingredient}: {e}")
-                records[idx] = build_record({0: ingredient})
+    # Rows are written as soon as they are next in input order, so only
+    # out-of-order (and still-to-repeat) rows are held in memory
+    with CsvStreamWriter(output_path) as out:
+        sink = _InputOrderWriter(out, [unique_idx[name] for name in ingredients])
 
-    output = write_csv(records, output_path)
-    print(f"\nOutput written to: {output}")
-    return output
+        if processes > 1:
+            print(f"Processing {len(unique)} ingredient(s) with {processes} process(es) "
+                  f"× {workers} worker(s)...")
+            for u, line in enumerate(_iter_in_processes(unique, workers, processes)):
+                sink.add_line(u, line)
+        else:
+            print(f"Processing {len(unique)} ingredient(s) with {workers} worker(s)...")
+            asyncio.run(_run_pipeline_async(unique, workers, sink.add))
+
+    print(f"\nOutput written to: {out.path}")
+    return out.path
 
 
 def parse_args() -> argparse.Namespace:
@@ -131,12 +319,27 @@ def parse_args() -> argparse.Namespace:
                         help="Column name for ingredient names in CSV/XLSX input")
     parser.add_argument("--workers", metavar="N", type=int, default=MAX_WORKERS,
                         help=f"Parallel workers (default: {MAX_WORKERS})")
+    parser.add_argument("--processes", metavar="N", type=int, default=1,
+                        help="Worker processes, each running --workers workers (default: 1)")
+    parser.add_argument("--force-rescrape", action="store_true",
+                        help="Ignore scrape results cached by previous runs")
+    parser.add_argument("--verbose", action="store_true",
+                        help="Log full tracebacks for enricher errors")
 
     return parser.parse_args()
 
 
 def main():
     args = parse_args()
+    listener = _start_log_listener(args.verbose)
+    try:
+        _main(args)
+    finally:
+        listener.stop()   # flushes records still on the queue
+
+
+def _main(args: argparse.Namespace) -> None:
+    set_force_rescrape(args.force_rescrape)
 
     if args.csv:
         if not os.path.exists(args.csv):
@@ -158,7 +361,8 @@ def main():
         sys.exit(1)
 
     print(f"Loaded {len(ingredients)} ingredient(s).")
-    run_pipeline(ingredients, output_path=args.output, workers=args.workers)
+    run_pipeline(ingredients, output_path=args.output, workers=args.workers,
+                 processes=args.processes)
 
 
 if __name__ == "__main__":
@@ -6,34 +6,125 @@ original format:
   Row 2+: data rows
 """
 
-import csv
 import os
-from typing import List, Dict, Any
+import re
+from typing import Dict, Any, Iterable, Sequence
 
-from schema import COLUMNS, COLUMN_NAMES, NUMERIC_INDEX
+from schema import COLUMNS, COLUMN_NAMES, NAME_TO_INDICES, NUMERIC_INDEX
 
 
-def _format_value(value: Any, col_type: str) -> str:
-    """Convert a Python value to its CSV string representation."""
+# ── Per-type formatters ───────────────────────────────────────────────────────
+
+def _fmt_str(value: Any) -> str:
+    if value is None or value == "":
+        return ""
+    return str(value)
+
+
+def _fmt_bool(value: Any) -> str:
     if value is None or value == "":
         return ""
-    if col_type == "bool":
-        if isinstance(value, bool):
-            return "TRUE" if value else "FALSE"
-        if isinstance(value, str):
-            return value.upper() if value.lower() in ("true", "false") else value
-    if col_type == "float":
-        try:
-            f = float(value)
-            # Drop unnecessary trailing zeros (e.g. 2.0 → "2", 2.5 → "2.5")
-            return str(int(f)) if f == int(f) else str(f)
-        except (ValueError, TypeError):
-            return str(value)
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, str):
+        return value.upper() if value.lower() in ("true", "false") else value
     return str(value)
 
 
+def _fmt_float(value: Any) -> str:
+    if value is None or value == "":
+        return ""
+    try:
+        f = float(value)
+        # Drop unnecessary trailing zeros (e.g. 2.0 → "2", 2.5 → "2.5")
+        return str(int(f)) if f == int(f) else str(f)
+    except (ValueError, TypeError):
+        return str(value)
+
+
+_FORMATTERS = {"bool": _fmt_bool, "float": _fmt_float}
+
+# (col_idx, default, formatter) per column, resolved once from the static schema
+_COLUMN_FORMATS = tuple(
+    (col_idx, default, _FORMATTERS.get(col_type, _fmt_str))
+    for col_idx, (_, _, col_type, default) in enumerate(COLUMNS)
+)
+
+
+# ── Row encoding ──────────────────────────────────────────────────────────────
+# Same bytes as csv.writer's default dialect: fields containing a comma,
+# quote or line break are quoted (quotes doubled); rows end in "\r\n".
+
+_NEEDS_QUOTING = re.compile(r'[,"\r\n]')
+
+
+def _encode_field(field: str) -> str:
+    if _NEEDS_QUOTING.search(field):
+        return '"' + field.replace('"', '""') + '"'
+    return field
+
+
+def _encode_row(fields: Sequence[str]) -> str:
+    # Fast path: one scan over the concatenated row; most rows need no quoting
+    if _NEEDS_QUOTING.search("".join(fields)):
+        return ",".join(map(_encode_field, fields)) + "\r\n"
+    return ",".join(fields) + "\r\n"
+
+
+# Both header rows are schema constants — encoded once
+_HEADER = (
+    # Row 0: numeric index row (blank string where index is None)
+    _encode_row(["" if idx is None else str(idx) for idx in NUMERIC_INDEX])
+    # Row 1: column names
+    + _encode_row(COLUMN_NAMES)
+)
+
+
+def format_record(record: Dict[int, Any]) -> str:
+    """Encode one record (column index → value) as a CSV line, "\r\n" included."""
+    return _encode_row([
+        fmt(record.get(col_idx, default))
+        for col_idx, default, fmt in _COLUMN_FORMATS
+    ])
+
+
+class CsvStreamWriter:
+    """
+    Incremental form of write_csv(): the two header rows are written on
+    open, data rows one at a time as they become available, so callers
+    need not hold every record in memory.
+
+    Usage:
+        with CsvStreamWriter("out.csv") as out:
+            for record in records:
+                out.write_record(record)
+    """
+
+    def __init__(self, output_path: str):
+        os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+        self.path = os.path.abspath(output_path)
+        self._f = open(output_path, "w", newline="", encoding="utf-8", buffering=1 << 20)
+        self._f.write(_HEADER)
+
+    def write_record(self, record: Dict[int, Any]) -> None:
+        self._f.write(format_record(record))
+
+    def write_line(self, line: str) -> None:
+        """Write a line already produced by format_record()."""
+        self._f.write(line)
+
+    def close(self) -> None:
+        self._f.close()
+
+    def __enter__(self) -> "CsvStreamWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
 def write_csv(
-    records: List[Dict[str, Any]],
+    records: Iterable[Dict[int, Any]],
     output_path: str,
 ) -> str:
     """
@@ -48,28 +139,10 @@ def write_csv(
     Returns:
         Absolute path of the written file.
     """
-    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
-
-    with open(output_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-
-        # Row 0: numeric index row (blank string where index is None)
-        writer.writerow(
-            ["" if idx is None else str(idx) for idx in NUMERIC_INDEX]
-        )
-
-        # Row 1: column names
-        writer.writerow(COLUMN_NAMES)
-
-        # Data rows
+    with CsvStreamWriter(output_path) as out:
         for record in records:
-            row = []
-            for col_idx, (col_name, _, col_type, default) in enumerate(COLUMNS):
-                raw_val = record.get(col_idx, default)
-                row.append(_format_value(raw_val, col_type))
-            writer.writerow(row)
-
-    return os.path.abspath(output_path)
+            out.write_record(record)
+    return out.path
 
 
 def build_record(data: Dict[str, Any]) -> Dict[int, Any]:
@@ -86,11 +159,6 @@ def build_record(data: Dict[str, Any]) -> Dict[int, Any]:
             56: "Helps with redness.",   # Rosacea Description (col 56)
         })
     """
-    # Build a name → [list of col indices] map to handle duplicates
-    name_to_indices: Dict[str, List[int]] = {}
-    for i, name in enumerate(COLUMN_NAMES):
-        name_to_indices.setdefault(name, []).append(i)
-
     record: Dict[int, Any] = {}
 
     # Track how many times each name has been used (for duplicate resolution)
@@ -101,7 +169,7 @@ def build_record(data: Dict[str, Any]) -> Dict[int, Any]:
             # Direct positional key — use as-is
             record[key] = value
         else:
-            indices = name_to_indices.get(key)
+            indices = NAME_TO_INDICES.get(key)
             if indices is None:
                 raise KeyError(
                     f"Unknown column name: {repr(key)}. "
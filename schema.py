@@ -4,14 +4,20 @@ schema.py — Single source of truth for all column definitions.
 The output CSV has two header rows (matching the original format):
   Row 0: numeric index (0–89) for the first 90 cols, blank for the last 4
   Row 1: actual column names
+
+Everything here is fixed at import and read on every output row, so the
+definitions are immutable: tuples for the column lists and read-only views
+for the per-column maps.
 """
 
+from types import MappingProxyType
+
 # ── Column definitions ────────────────────────────────────────────────────────
 # Each entry: (column_name, numeric_index_or_None, data_type, default_value)
 #   data_type: "str" | "float" | "bool" | "int"
 #   numeric_index: the value shown in row 0 of the original file (None = blank)
 
-COLUMNS = [
+COLUMNS = (
     # ── Identity ──────────────────────────────────────────────────────────────
     ("Ingredient name",                   0,    "str",   None),
     ("INCI Name",                         1,    "str",   None),
@@ -138,22 +144,34 @@ COLUMNS = [
     ("Predicted or manual",              None, "str",   None),
     ("Correction made",                  None, "str",   None),
     ("Description",                      None, "str",   None),   # correction description
-]
+)
 
 # Derived helpers used by output/csv_writer.py
-COLUMN_NAMES   = [c[0] for c in COLUMNS]          # 94 names (with duplicates)
-NUMERIC_INDEX  = [c[1] for c in COLUMNS]          # row-0 values (int or None)
-COLUMN_TYPES   = {i: c[2] for i, c in enumerate(COLUMNS)}
-COLUMN_DEFAULTS= {i: c[3] for i, c in enumerate(COLUMNS)}
+COLUMN_NAMES   = tuple(c[0] for c in COLUMNS)     # 94 names (with duplicates)
+NUMERIC_INDEX  = tuple(c[1] for c in COLUMNS)     # row-0 values (int or None)
+COLUMN_TYPES   = MappingProxyType({i: c[2] for i, c in enumerate(COLUMNS)})
+COLUMN_DEFAULTS= MappingProxyType({i: c[3] for i, c in enumerate(COLUMNS)})
+
+
+def _name_to_indices() -> dict:
+    indices: dict = {}
+    for i, (name, *_) in enumerate(COLUMNS):
+        indices.setdefault(name, []).append(i)
+    return {name: tuple(idx) for name, idx in indices.items()}
+
+
+# Column name → column indices, in order; duplicate names (e.g. "Description")
+# map to several. Use instead of COLUMN_NAMES.index(), which scans the tuple.
+NAME_TO_INDICES = MappingProxyType(_name_to_indices())
 
 # Positional groups (by column index) for enricher routing
-GROUPS = {
-    "identity":   list(range(0, 3)),
-    "safety":     list(range(3, 15)),
-    "skin_type":  list(range(15, 31)),
-    "age":        list(range(31, 37)),
-    "dietary":    list(range(37, 55)),
-    "concerns":   list(range(55, 79)),
-    "benefits":   list(range(79, 88)),
-    "conc_qa":    list(range(88, 94)),
-}
+GROUPS = MappingProxyType({
+    "identity":   tuple(range(0, 3)),
+    "safety":     tuple(range(3, 15)),
+    "skin_type":  tuple(range(15, 31)),
+    "age":        tuple(range(31, 37)),
+    "dietary":    tuple(range(37, 55)),
+    "concerns":   tuple(range(55, 79)),
+    "benefits":   tuple(range(79, 88)),
+    "conc_qa":    tuple(range(88, 94)),
+})
@@ -0,0 +1,227 @@
+"""
+scrapers/_browser.py — Playwright helpers shared by the scrapers.
+
+LazyBrowser starts Chromium only when a page is actually needed and keeps
+it for every later page on the same event loop. A long run would otherwise
+keep one Chromium alive for thousands of pages, so after BROWSER_MAX_PAGES
+the instance is retired: new pages go to a fresh one, and the old one is
+closed as soon as its last open page is.
+
+All pages of one instance share a browser context, so scripts and styles
+fetched by the first page come from Chromium's HTTP cache for the rest. The
+scrapers only read text and table cells, so the context is routed to skip
+images, fonts and media. Stylesheets still load: innerText and Playwright's
+visibility checks depend on CSS, and without it hidden menus and dialogs
+would leak into the text that badges are read from.
+
+shared_browser() gives a scraper module its process-wide LazyBrowser for
+the scraper loop, and scrape_batch() runs a batch of ingredients through a
+scraper's per-page coroutine in a LazyBrowser of its own.
+"""
+
+import asyncio
+import logging
+import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable, List, Optional, TypeVar
+
+from config import BROWSER_MAX_PAGES
+from scrapers import _loop
+from scrapers._throttle import LIMITER
+
+try:
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+    from playwright.async_api import async_playwright
+except ImportError:   # optional — scrapes that need a browser return an error result
+    async_playwright = None
+
+    class PlaywrightTimeoutError(Exception):
+        """Stand-in so `except PlaywrightTimeoutError` works without Playwright."""
+
+
+T = TypeVar("T")
+
+log = logging.getLogger(__name__)
+
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+
+
+async def _skip_heavy(route) -> None:
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def wait_quietly(waiting: Awaitable) -> None:
+    """
+    Await a Playwright wait whose timeout is the fixed pause it replaces:
+    on timeout the page is read as it is, exactly as after the old sleep.
+    """
+    try:
+        await waiting
+    except PlaywrightTimeoutError:
+        pass
+
+
+class _Instance:
+    """One launched Chromium, its shared context and the pages handed out from it."""
+
+    __slots__ = ("browser", "context", "pages_opened", "pages_open")
+
+    def __init__(self, browser, context):
+        self.browser = browser
+        self.context = context
+        self.pages_opened = 0
+        self.pages_open = 0
+
+
+class LazyBrowser:
+    """
+    Headless Chromium, launched on first page() and relaunched if it has gone
+    away or has served max_uses pages. Use from one event loop only.
+
+    Usage:
+        async with browser.page() as page:
+            await page.goto(url)
+    """
+
+    def __init__(self, max_uses: Optional[int] = BROWSER_MAX_PAGES):
+        self.max_uses = max_uses
+        self._forget()
+
+    def _forget(self) -> None:
+        """Drop all state without closing anything (the browsers may belong to another process)."""
+        self._playwright = None
+        self._current: Optional[_Instance] = None
+        self._retired: List[_Instance] = []
+        self._lock = asyncio.Lock()
+
+    def _worn_out(self, inst: _Instance) -> bool:
+        return (
+            not inst.browser.is_connected()
+            or (self.max_uses is not None and inst.pages_opened >= self.max_uses)
+        )
+
+    async def _acquire(self) -> _Instance:
+        if async_playwright is None:
+            raise RuntimeError(
+                "Playwright is not installed "
+                "(pip install playwright && playwright install chromium)"
+            )
+        async with self._lock:
+            if self._current is not None and self._worn_out(self._current):
+                self._retired.append(self._current)
+                self._current = None
+                await self._close_idle()
+            if self._current is None:
+                if self._playwright is None:
+                    self._playwright = await async_playwright().start()
+                browser = await self._playwright.chromium.launch(headless=True)
+                context = await browser.new_context()
+                await context.route("**/*", _skip_heavy)
+                self._current = _Instance(browser, context)
+            inst = self._current
+            inst.pages_opened += 1
+            inst.pages_open += 1
+            return inst
+
+    async def _close_idle(self) -> None:
+        """Close retired instances that no longer have open pages."""
+        idle = [inst for inst in self._retired if inst.pages_open == 0]
+        self._retired = [inst for inst in self._retired if inst.pages_open > 0]
+        for inst in idle:
+            try:
+                await inst.browser.close()
+            except Exception:
+                pass
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator:
+        """
+        A new page in the shared context, which does not download images,
+        fonts or media. Closed on exit.
+        """
+        inst = await self._acquire()
+        try:
+            page = await inst.context.new_page()
+            try:
+                yield page
+            finally:
+                try:
+                    await page.close()
+                except Exception:
+                    pass
+        finally:
+            inst.pages_open -= 1
+            if inst in self._retired:
+                await self._close_idle()
+
+    async def close(self) -> None:
+        """Close every instance, including retired ones with pages still open."""
+        instances = self._retired + ([self._current] if self._current else [])
+        self._current, self._retired = None, []
+        for inst in instances:
+            try:
+                await inst.browser.close()
+            except Exception:
+                pass
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+
+def shared_browser() -> LazyBrowser:
+    """
+    A LazyBrowser for single scrapes submitted to the scraper loop
+    (scrapers._loop) from any thread. It is closed when the loop shuts down;
+    a forked child, which starts its own loop, gets it back unlaunched.
+    """
+    browser = LazyBrowser()
+    _loop.on_shutdown(browser.close)
+    os.register_at_fork(after_in_child=browser._forget)
+    return browser
+
+
+async def scrape_batch(
+    scrape_one: Callable[[LazyBrowser, str, Optional[float]], Awaitable[T]],
+    ingredients: list,
+    site: str,
+    delay_seconds: Optional[float] = None,
+    concurrency: Optional[int] = None,
+    found_note: Optional[Callable[[T], str]] = None,
+) -> List[T]:
+    """
+    Run scrape_one(browser, ingredient, delay_seconds) for every ingredient,
+    sharing one LazyBrowser that is closed at the end, up to `concurrency`
+    pages at a time (default MAX_CONCURRENT_PER_DOMAIN). LIMITER keeps page
+    loads spaced. Results must have `found` and `error`; found_note(result)
+    is appended to the progress line of found ones. Results are in input order.
+    """
+    total = len(ingredients)
+    done = 0
+    slots = asyncio.Semaphore(concurrency or LIMITER.max_concurrent)
+    browser = LazyBrowser()
+
+    async def _one(ingredient: str) -> T:
+        nonlocal done
+        async with slots:
+            result = await scrape_one(browser, ingredient, delay_seconds)
+
+        # One progress record per ingredient, numbered in completion order
+        done += 1
+        if result.found:
+            note = found_note(result) if found_note else ""
+            log.info("[%d/%d] %s ✓ %.60s%s", done, total, site, ingredient, note)
+        elif result.error:
+            log.info("[%d/%d] %s ✗ %.60s — error: %s", done, total, site, ingredient, result.error)
+        else:
+            log.info("[%d/%d] %s ✗ %.60s — not found", done, total, site, ingredient)
+        return result
+
+    try:
+        results = await asyncio.gather(*(_one(ing) for ing in ingredients))
+    finally:
+        await browser.close()
+
+    return list(results)
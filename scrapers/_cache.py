@@ -0,0 +1,223 @@
+"""
+scrapers/_cache.py — Scrape cache shared by the scraper modules.
+
+Two layers:
+  1. In-memory dict, keyed by normalised ingredient name (stripped, lowercased)
+  2. SQLite file (config.SCRAPE_CACHE_PATH) so repeat runs skip the network;
+     rows older than SCRAPE_CACHE_TTL_DAYS are treated as missing
+
+Lookups are single-flight: when several enrichers ask for the same
+ingredient at once, the first caller fetches and the rest wait for its
+result instead of starting their own browser session.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import asdict
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from config import SCRAPE_CACHE_PATH, SCRAPE_CACHE_TTL_DAYS
+
+log = logging.getLogger(__name__)
+
+
+def normalize_key(ingredient: str) -> str:
+    """Cache key for an ingredient name."""
+    return ingredient.strip().lower()
+
+
+# ── On-disk store ─────────────────────────────────────────────────────────────
+
+class DiskStore:
+    """SQLite table of serialised scrape results: (source, key) → JSON payload."""
+
+    def __init__(self, path: str, ttl_seconds: float):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS scrape_cache ("
+            " source TEXT NOT NULL,"
+            " key TEXT NOT NULL,"
+            " payload TEXT NOT NULL,"
+            " fetched_at REAL NOT NULL,"
+            " PRIMARY KEY (source, key))"
+        )
+        self._conn.commit()
+        self._ttl = ttl_seconds
+        self._lock = threading.Lock()
+
+    def get(self, source: str, key: str) -> Optional[dict]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, fetched_at FROM scrape_cache WHERE source = ? AND key = ?",
+                (source, key),
+            ).fetchone()
+        if row is None or time.time() - row[1] > self._ttl:
+            return None
+        return json.loads(row[0])
+
+    def put(self, source: str, key: str, payload: dict) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO scrape_cache (source, key, payload, fetched_at)"
+                " VALUES (?, ?, ?, ?)",
+                (source, key, json.dumps(payload), time.time()),
+            )
+            self._conn.commit()
+
+
+_store: Optional[DiskStore] = None
+_store_lock = threading.Lock()
+_store_failed = False
+_force_rescrape = False
+_inherited_stores: List[DiskStore] = []   # parent connections seen after fork()
+
+
+def _get_store() -> Optional[DiskStore]:
+    """Open the shared on-disk store on first use; None if disabled or unavailable."""
+    global _store, _store_failed
+    if _store is not None or _store_failed or not SCRAPE_CACHE_PATH:
+        return _store
+    with _store_lock:
+        if _store is None and not _store_failed:
+            try:
+                _store = DiskStore(SCRAPE_CACHE_PATH, SCRAPE_CACHE_TTL_DAYS * 86400)
+            except (OSError, sqlite3.Error) as e:
+                log.warning("Scrape cache: disk cache disabled (%s): %s", SCRAPE_CACHE_PATH, e)
+                _store_failed = True
+    return _store
+
+
+def _forget_store() -> None:
+    # SQLite connections must not be used across fork(): the child opens its
+    # own. The parent's connection is kept referenced so it is never closed
+    # (and finalised) from the child either.
+    global _store, _store_lock, _store_failed
+    if _store is not None:
+        _inherited_stores.append(_store)
+    _store, _store_failed = None, False
+    _store_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_forget_store)
+
+
+def set_force_rescrape(enabled: bool) -> None:
+    """Ignore previously stored results (fresh results are still written)."""
+    global _force_rescrape
+    _force_rescrape = enabled
+
+
+def is_force_rescrape() -> bool:
+    return _force_rescrape
+
+
+# ── Per-scraper cache ─────────────────────────────────────────────────────────
+
+class ScrapeCache:
+    """
+    Cache for one scraper's results.
+
+    Args:
+        source:       Name of the scraper, used to namespace rows on disk.
+        result_type:  Dataclass the scraper returns; rebuilt from stored JSON.
+    """
+
+    def __init__(self, source: str, result_type: type):
+        self.source = source
+        self.result_type = result_type
+        self._data: Dict[str, Any] = {}
+        self._inflight: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def _load(self, key: str) -> Optional[Any]:
+        store = _get_store()
+        if store is None or _force_rescrape:
+            return None
+        try:
+            payload = store.get(self.source, key)
+        except (sqlite3.Error, ValueError) as e:
+            # Locked by another process, unreadable or corrupt: treat as a miss
+            log.warning("Scrape cache: could not read %r: %s", key, e)
+            return None
+        if payload is None:
+            return None
+        try:
+            return self.result_type(**payload)
+        except TypeError:
+            return None   # Stored under an older result schema — re-scrape
+
+    def _save(self, key: str, value: Any) -> None:
+        store = _get_store()
+        # Failed scrapes stay in memory only so the next run retries them
+        if store is None or getattr(value, "error", None):
+            return
+        try:
+            store.put(self.source, key, asdict(value))
+        except sqlite3.Error as e:
+            log.warning("Scrape cache: could not store %r: %s", key, e)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Cached value for key from memory or disk, or None."""
+        if key in self._data:
+            return self._data[key]
+        value = self._load(key)
+        if value is not None:
+            self._data[key] = value
+        return value
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._data[key] = value
+        self._save(key, value)
+
+    def missing(self, ingredients: Iterable[str]) -> List[str]:
+        """
+        Names still to scrape: the first name for each key found neither in
+        memory nor on disk, in input order.
+        """
+        pending: Dict[str, str] = {}
+        for ingredient in ingredients:
+            key = normalize_key(ingredient)
+            if key not in pending and key not in self:
+                pending[key] = ingredient
+        return list(pending.values())
+
+    def get_or_fetch(self, key: str, fetch: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for key, calling fetch() at most once per key
+        even when called concurrently from several threads.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        with self._lock:
+            key_lock = self._inflight.setdefault(key, threading.Lock())
+
+        with key_lock:
+            value = self.get(key)
+            if value is None:
+                value = fetch()
+                self[key] = value
+
+        with self._lock:
+            self._inflight.pop(key, None)
+
+        return value
+
+    def clear(self) -> None:
+        """Clear the in-memory layer (the on-disk store is kept)."""
+        self._data.clear()
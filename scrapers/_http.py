@@ -0,0 +1,29 @@
+"""
+scrapers/_http.py — Shared HTTP session for plain (non-browser) requests.
+
+One requests.Session per process keeps TCP/TLS connections alive across
+scrapers and enrichers; the adapter pool is sized to MAX_WORKERS so every
+worker thread can hold a warm connection to the same host.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from config import MAX_RETRIES, MAX_WORKERS, REQUEST_TIMEOUT_SECONDS, USER_AGENT
+
+SESSION = requests.Session()
+SESSION.headers.update({"User-Agent": USER_AGENT})
+
+_adapter = HTTPAdapter(
+    pool_connections=MAX_WORKERS,
+    pool_maxsize=MAX_WORKERS,
+    max_retries=MAX_RETRIES,
+)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    """SESSION.get with the configured default timeout."""
+    kwargs.setdefault("timeout", REQUEST_TIMEOUT_SECONDS)
+    return SESSION.get(url, **kwargs)
@@ -0,0 +1,76 @@
+"""
+scrapers/_loop.py — One long-lived event loop for synchronous scraper calls.
+
+scrape_cosing() and scrape_skinsafe() are called from enricher threads.
+Rather than each call running asyncio.run() — a new loop, and with it a new
+Playwright driver and browser — their coroutines are submitted to a single
+loop running on a daemon thread for the life of the process, so objects
+bound to that loop (browsers) can be reused from one call to the next.
+
+Cleanup registered with on_shutdown() runs on the loop at interpreter exit.
+"""
+
+import asyncio
+import atexit
+import os
+import threading
+from typing import Awaitable, Callable, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_thread: Optional[threading.Thread] = None
+_lock = threading.Lock()
+_shutdown_hooks: List[Callable[[], Awaitable[None]]] = []
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    global _loop, _thread
+    with _lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            _thread = threading.Thread(target=_loop.run_forever, name="scraper-loop", daemon=True)
+            _thread.start()
+        return _loop
+
+
+def run(coro: Awaitable[T]) -> T:
+    """Run coro on the shared loop and block the calling thread for its result."""
+    loop = _get_loop()
+    if threading.current_thread() is _thread:
+        raise RuntimeError("scrapers._loop.run() called from the scraper loop itself")
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+
+def on_shutdown(close: Callable[[], Awaitable[None]]) -> None:
+    """Await close() on the shared loop at interpreter exit (e.g. to close a browser)."""
+    _shutdown_hooks.append(close)
+
+
+async def _run_shutdown_hooks() -> None:
+    for close in reversed(_shutdown_hooks):
+        try:
+            await close()
+        except Exception:
+            pass
+
+
+def _shutdown() -> None:
+    if _loop is None:
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(_run_shutdown_hooks(), _loop).result(timeout=10)
+    except Exception:
+        pass
+    _loop.call_soon_threadsafe(_loop.stop)
+
+
+def _forget_loop() -> None:
+    # A forked child inherits the loop object but not the thread running it
+    global _loop, _thread, _lock
+    _loop = _thread = None
+    _lock = threading.Lock()
+
+
+atexit.register(_shutdown)
+os.register_at_fork(after_in_child=_forget_loop)
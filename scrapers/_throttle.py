@@ -0,0 +1,71 @@
+"""
+scrapers/_throttle.py — Per-domain politeness limits shared by all scrapers.
+
+Two limits per host (e.g. CosIng and SkinSafe are tracked independently):
+  - spacing:     consecutive page loads start at least REQUEST_DELAY_SECONDS apart
+  - concurrency: at most MAX_CONCURRENT_PER_DOMAIN loads in flight at once
+
+Every page load runs on the one scraper event loop (scrapers._loop) and
+awaits wait_async(), which books the next free start time for its host and
+sleeps until then. The concurrency slots are taken by the enricher worker
+threads around their synchronous scrape calls, so the bookkeeping is kept
+under a thread lock.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+from config import MAX_CONCURRENT_PER_DOMAIN, REQUEST_DELAY_SECONDS
+
+
+def _host(url: str) -> str:
+    return urlsplit(url).hostname or url
+
+
+class DomainLimiter:
+
+    def __init__(self, delay_seconds: float, max_concurrent: int):
+        self.delay_seconds = delay_seconds
+        self.max_concurrent = max_concurrent
+        self._next_start: Dict[str, float] = {}
+        self._slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def _reserve(self, url: str, delay_seconds: Optional[float]) -> float:
+        """Book the next start time for url's host; return seconds to wait."""
+        delay = self.delay_seconds if delay_seconds is None else delay_seconds
+        host = _host(url)
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start.get(host, now))
+            self._next_start[host] = start + delay
+        return start - now
+
+    async def wait_async(self, url: str, delay_seconds: Optional[float] = None) -> None:
+        """Await until a request to url's host may start."""
+        pause = self._reserve(url, delay_seconds)
+        if pause > 0:
+            await asyncio.sleep(pause)
+
+    def share(self, parts: int) -> None:
+        """
+        Give this process 1/parts of the per-domain budget, for when `parts`
+        worker processes each run their own limiter against the same sites.
+        Call before any request is made.
+        """
+        self.delay_seconds *= parts
+        self.max_concurrent = max(1, self.max_concurrent // parts)
+
+    def slots(self, url: str) -> threading.BoundedSemaphore:
+        """Semaphore bounding concurrent sessions against url's host."""
+        host = _host(url)
+        with self._lock:
+            if host not in self._slots:
+                self._slots[host] = threading.BoundedSemaphore(self.max_concurrent)
+            return self._slots[host]
+
+
+LIMITER = DomainLimiter(REQUEST_DELAY_SECONDS, MAX_CONCURRENT_PER_DOMAIN)
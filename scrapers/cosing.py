@@ -12,13 +12,19 @@ Install: pip install playwright && playwright install chromium
 """
 
 import asyncio
-from typing import Optional
-from dataclasses import dataclass
+import re
+from typing import List, Optional
+from dataclasses import dataclass, replace
+
+from scrapers import _loop
+from scrapers._browser import LazyBrowser, scrape_batch, shared_browser, wait_quietly
+from scrapers._cache import ScrapeCache, normalize_key
+from scrapers._throttle import LIMITER
 
 COSING_URL = "https://ec.europa.eu/growth/tools-databases/cosing/"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CosingResult:
     ingredient_name: str
     inci_name:        Optional[str] = None
@@ -37,23 +43,36 @@ def _clean_search_term(ingredient: str) -> str:
     return ingredient.split("(")[0].strip()
 
 
+# Reads every table row in one round-trip: [label, value, [<li> texts]] per row.
+# Only the Functions row uses its <li> items, so only it collects them.
+_DETAIL_ROWS_JS = """
+() => Array.from(document.querySelectorAll("table tr"), row => {
+    const cells = row.querySelectorAll("td, th");
+    if (!cells.length) return null;
+    const label = cells[0].innerText.trim().toLowerCase();
+    const value = cells[1];
+    return [
+        label,
+        value ? value.innerText.trim() : "",
+        value && label === "functions"
+            ? Array.from(value.querySelectorAll("li"), li => li.innerText.trim())
+            : [],
+    ];
+}).filter(Boolean)
+"""
+
+
 async def _parse_detail_page(page) -> dict:
     """
     Parse the CosIng detail page by reading each table row as a label/value pair.
     Reading table cells directly (rather than inner_text of the whole body) means
-    empty cells stay empty — no bleed-through from adjacent rows.
+    empty cells stay empty — no bleed-through from adjacent rows. The cells are
+    read in the page by a single evaluate() call; only the label dispatch runs
+    here.
     """
     data = {}
 
-    rows = await page.query_selector_all("table tr")
-    for row in rows:
-        cells = await row.query_selector_all("td, th")
-        if not cells:
-            continue
-
-        label = (await cells[0].inner_text()).strip().lower()
-        raw_value = (await cells[1].inner_text()).strip() if len(cells) >= 2 else ""
-
+    for label, raw_value, items in await page.evaluate(_DETAIL_ROWS_JS):
         if not label:
             continue
 
@@ -74,10 +93,8 @@ async def _parse_detail_page(page) -> dict:
 
         elif label == "functions":
             # Functions render as bullet <li> items inside the cell
-            items = await cells[1].query_selector_all("li") if len(cells) >= 2 else []
             if items:
-                texts = [(await li.inner_text()).strip() for li in items]
-                data["role"] = ", ".join(t for t in texts if t)
+                data["role"] = ", ".join(t for t in items if t)
             elif raw_value:
                 data["role"] = raw_value
 
@@ -87,31 +104,79 @@ async def _parse_detail_page(page) -> dict:
     return data
 
 
-async def _scrape_one(ingredient: str) -> CosingResult:
-    """Async scrape of a single ingredient from CosIng."""
-    from playwright.async_api import async_playwright
+_TOTAL_SELECTOR = r"text=/Total: \d+/"
+_TOTAL          = re.compile(r"Total: (\d+)")
+
+# Texts of every results-table link, read in one round-trip
+_LINK_TEXTS_JS = """
+() => Array.from(document.querySelectorAll("table a"), a => a.innerText.trim().toUpperCase())
+"""
+
+
+def _pick_result_link(link_texts: List[str], target: str) -> Optional[int]:
+    """
+    Index of the result to open: the first link whose text is exactly the
+    (uppercased) search term, else the first starting with its first word.
+    """
+    for i, text in enumerate(link_texts):
+        if text == target:
+            return i
+    first_word = target.split()[0]
+    for i, text in enumerate(link_texts):
+        if text.startswith(first_word):
+            return i
+    return None
+
+
+# True once a row label that only the detail table has (see _parse_detail_page)
+# is on the page. It checks the document, not a handle into the results page,
+# so it keeps working if the click navigates to a new document.
+_DETAIL_SHOWN_JS = """
+labels => Array.from(document.querySelectorAll("table tr"), row => {
+    const cell = row.querySelector("td, th");
+    return cell ? cell.innerText.trim().toLowerCase() : "";
+}).some(label => labels.includes(label))
+"""
+_DETAIL_ONLY_LABELS = ["cas #", "ec #", "functions"]
 
+
+async def _wait_for_detail(page) -> None:
+    await wait_quietly(page.wait_for_function(
+        _DETAIL_SHOWN_JS, arg=_DETAIL_ONLY_LABELS, timeout=10_000,
+    ))
+
+
+async def _scrape_one(
+    browser: LazyBrowser,
+    ingredient: str,
+    delay_seconds: Optional[float] = None,
+) -> CosingResult:
+    """
+    Async scrape of a single ingredient from CosIng in a new page of browser.
+    delay_seconds overrides the per-domain spacing (default REQUEST_DELAY_SECONDS).
+    """
     result = CosingResult(ingredient_name=ingredient)
     search_term = _clean_search_term(ingredient)
 
     try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
-
-            await page.goto(COSING_URL, wait_until="networkidle", timeout=30_000)
-            await asyncio.sleep(2)
+        async with browser.page() as page:
+            await LIMITER.wait_async(COSING_URL, delay_seconds)
+            await page.goto(COSING_URL, wait_until="domcontentloaded", timeout=30_000)
 
             # ── Search ────────────────────────────────────────────────────────
+            # fill() and click() wait for the form to render and become enabled
             await page.fill('input[type="text"]', search_term)
-            await asyncio.sleep(1)
             await page.click('button[type="submit"]')
-            await asyncio.sleep(3)
+            # The "Total: N" summary appears once the results are in. Without
+            # it nothing is confirmed, so a slow search is an error (retried
+            # next run) rather than a cached "not found".
+            await wait_quietly(page.wait_for_selector(_TOTAL_SELECTOR, timeout=10_000))
 
             page_text = await page.inner_text("body")
-
-            if "Total: 0" in page_text:
-                await browser.close()
+            total = _TOTAL.search(page_text)
+            if total is None:
+                return replace(result, error="CosIng search results did not load")
+            if total.group(1) == "0":
                 return result  # Not found
 
             # ── Click first exact-match result link ───────────────────────────
@@ -119,72 +184,66 @@ async def _scrape_one(ingredient: str) -> CosingResult:
             # matching the full search term (uppercased) to avoid partial matches
             # like "NIACINAMIDE/YEAST POLYPEPTIDE" when searching "niacinamide"
             target = search_term.upper()
-            links = await page.query_selector_all("table a")
-            clicked = False
-
-            for link in links:
-                try:
-                    link_text = (await link.inner_text()).strip().upper()
-                    if link_text == target:
-                        await link.click()
-                        await asyncio.sleep(3)
-                        clicked = True
-                        break
-                except Exception:
-                    continue
-
-            # Fallback: first link that starts with the first word
-            if not clicked:
-                first_word = target.split()[0]
-                links = await page.query_selector_all("table a")
-                for link in links:
-                    try:
-                        link_text = (await link.inner_text()).strip().upper()
-                        if link_text.startswith(first_word):
-                            await link.click()
-                            await asyncio.sleep(3)
-                            clicked = True
-                            break
-                    except Exception:
-                        continue
-
-            if not clicked:
-                await browser.close()
+            link_texts = await page.evaluate(_LINK_TEXTS_JS)
+            idx = _pick_result_link(link_texts, target)
+            if idx is None:
                 return result
 
+            await page.locator("table a").nth(idx).click()
+            await _wait_for_detail(page)
+
             # ── Parse detail page via table cells ─────────────────────────────
             parsed = await _parse_detail_page(page)
-
-            result.found       = True
-            result.inci_name   = parsed.get("inci_name")
-            result.aliases     = parsed.get("aliases")
-            result.role        = parsed.get("role")
-            result.description = parsed.get("description")
-            result.cas_no      = parsed.get("cas_no")
-            result.ec_no       = parsed.get("ec_no")
-            result.restriction = parsed.get("restriction")
-
-            await browser.close()
+            if not parsed:
+                return replace(result, error="CosIng detail page did not load")
+
+            result = CosingResult(
+                ingredient_name = ingredient,
+                found           = True,
+                inci_name       = parsed.get("inci_name"),
+                aliases         = parsed.get("aliases"),
+                role            = parsed.get("role"),
+                description     = parsed.get("description"),
+                cas_no          = parsed.get("cas_no"),
+                ec_no           = parsed.get("ec_no"),
+                restriction     = parsed.get("restriction"),
+            )
 
     except Exception as e:
-        result.error = str(e)
+        # Keep whatever was parsed before the failure
+        result = replace(result, error=str(e))
 
     return result
 
 
-_cache: dict = {}
+# ── Shared browser ────────────────────────────────────────────────────────────
+# scrape_cosing() is called from many enricher threads. Their scrapes all run
+# on the shared scraper loop (scrapers._loop) in one browser, launched on
+# first use, instead of a new event loop, driver and Chromium per call.
+
+_browser = shared_browser()
+
+
+_cache = ScrapeCache("cosing", CosingResult)
 
 
 def scrape_cosing(ingredient: str) -> CosingResult:
     """
     Synchronous wrapper — call this from enrichers.
     Results are cached by ingredient name so multiple enrichers sharing
-    the same ingredient never trigger more than one browser session.
+    the same ingredient never trigger more than one browser session —
+    including IdentityEnricher and SafetyEnricher running in different
+    threads at the same time.
     """
-    key = ingredient.strip().lower()
-    if key not in _cache:
-        _cache[key] = asyncio.run(_scrape_one(ingredient))
-    return _cache[key]
+    def _fetch():
+        with LIMITER.slots(COSING_URL):
+            try:
+                return _loop.run(_scrape_one(_browser, ingredient))
+            except Exception as e:
+                # Browser could not be started (e.g. Playwright not installed)
+                return CosingResult(ingredient_name=ingredient, error=str(e))
+
+    return _cache.get_or_fetch(normalize_key(ingredient), _fetch)
 
 
 def clear_cache() -> None:
@@ -195,35 +254,36 @@ def clear_cache() -> None:
 async def scrape_cosing_batch(
     ingredients: list,
     delay_seconds: float = 2.0,
+    concurrency: Optional[int] = None,
 ) -> list:
     """
-    Scrape multiple ingredients sequentially with a polite delay.
+    Scrape multiple ingredients in one browser, up to `concurrency` pages at
+    a time (default MAX_CONCURRENT_PER_DOMAIN). Page loads are still spaced
+    at least delay_seconds apart (shared with any other CosIng traffic).
     Returns results in the same order as the input list.
     """
-    results = []
-    total = len(ingredients)
-
-    for i, ingredient in enumerate(ingredients):
-        print(f"  [{i+1}/{total}] CosIng: {ingredient[:60]}...")
-        result = await _scrape_one(ingredient)
-
-        if result.found:
-            role_preview = (result.role or "")[:50]
-            print(f"         ✓ found — {role_preview}")
-        elif result.error:
-            print(f"         ✗ error — {result.error}")
-        else:
-            print(f"         ✗ not found")
-
-        results.append(result)
-        await asyncio.sleep(delay_seconds)
-
-    return results
+    return await scrape_batch(
+        _scrape_one, ingredients, "CosIng", delay_seconds, concurrency,
+        found_note=lambda result: f" — {(result.role or '')[:50]}",
+    )
 
 
 def scrape_cosing_batch_sync(
     ingredients: list,
     delay_seconds: float = 2.0,
+    concurrency: Optional[int] = None,
 ) -> list:
-    """Synchronous wrapper for batch scraping."""
-    return asyncio.run(scrape_cosing_batch(ingredients, delay_seconds))
\ No newline at end of file
+    """
+    Synchronous wrapper for batch scraping. Goes through the same cache as
+    scrape_cosing(): names already scraped (in this run or, via the disk
+    cache, an earlier one) are not fetched again, and each distinct name in
+    the batch is fetched once.
+    """
+    to_scrape = _cache.missing(ingredients)
+
+    if to_scrape:
+        fresh = asyncio.run(scrape_cosing_batch(to_scrape, delay_seconds, concurrency))
+        for r in fresh:
+            _cache[normalize_key(r.ingredient_name)] = r
+
+    return [_cache[normalize_key(i)] for i in ingredients]
\ No newline at end of file
@@ -3,17 +3,35 @@ scrapers/skinsafe.py — Scrape SkinSafe for ingredient badge data.
 
 Approach:
   1. Call JSON search API to get the ingredient page URL
-  2. Load that URL with Playwright to get badge data
+  2. Load that page with Playwright and read badges from its rendered text
+
+The badges are rendered client-side, and a page's static HTML still holds
+hidden menus and filters that mention badge words, so the raw HTML is never
+read for badges.
 """
 
 import asyncio
-import requests
-from typing import Optional
+import logging
+import re
+import threading
+from typing import Dict, Optional, Tuple
 from dataclasses import dataclass
 
+from logic._patterns import compile_flags, compile_terms, normalize
+from scrapers import _http
+from scrapers import _loop
+from scrapers._browser import LazyBrowser, scrape_batch, shared_browser, wait_quietly
+from scrapers._cache import ScrapeCache, normalize_key
+from scrapers._throttle import LIMITER
+
 SKINSAFE_BASE    = "https://www.skinsafeproducts.com"
 SKINSAFE_API     = "https://www.skinsafeproducts.com/users/search"
 
+log = logging.getLogger(__name__)
+
+# Value of every badge field when the ingredient could not be looked up
+NOT_FOUND = "Not found"
+
 _BADGE_KEYWORDS: dict = {
     "teen":           ["teen safe"],
     "vegetarian":     ["vegetarian"],
@@ -36,6 +54,8 @@ _BADGE_KEYWORDS: dict = {
     "dairy_free":     ["dairy free", "lactose free", "milk free"],
 }
 
+_NOT_FOUND_BADGES = dict.fromkeys(_BADGE_KEYWORDS, NOT_FOUND)
+
 _NAME_CONTAINS_NO: dict = {
     "gluten_free":    ["wheat", "barley", "gluten", "triticum"],
     "nut_free":       ["almond", "walnut", "hazelnut", "cashew", "pistachio",
@@ -50,77 +70,126 @@ _NAME_CONTAINS_NO: dict = {
     "silicon_free":   ["silicone", "dimethicone", "cyclomethicone", "siloxane"],
 }
 
-_UI_SKIP = {
+# One bit per field; every keyword list is matched in a single pass over the text
+_BADGE_BITS    = tuple((field, 1 << i) for i, field in enumerate(_BADGE_KEYWORDS))
+_BADGE_MATCH   = compile_flags({bit: _BADGE_KEYWORDS[field] for field, bit in _BADGE_BITS})
+_NAME_NO_BITS  = tuple((field, 1 << i) for i, field in enumerate(_NAME_CONTAINS_NO))
+_NAME_NO_MATCH = compile_flags({bit: _NAME_CONTAINS_NO[field] for field, bit in _NAME_NO_BITS})
+_BADGE_WORDS   = sorted({kw for kws in _BADGE_KEYWORDS.values() for kw in kws})
+
+_UI_SKIP = frozenset({
     "sign in", "register", "brands", "category", "premium",
     "explore", "trial", "subscribe", "log in", "search",
     "home", "ingredients", "products", "contact", "about",
     "teen safe", "vegan", "vegetarian", "paraben", "gluten",
     "sulfate", "silicone", "fragrance", "view all", "show more",
-}
+})
+# Every UI phrase checked in one pass over a candidate line. Exact badge
+# labels are left out: a description that says "vegan" is still a
+# description, and a strip of badges is caught by its other words.
+_UI_SKIP_MATCH = compile_terms(_UI_SKIP.difference(_BADGE_WORDS))
 
 
 def _lookup_ingredient_url(ingredient: str) -> Optional[str]:
     """
     Call the SkinSafe search API and return the URL of the first
-    ingredient suggestion. Returns None if not found.
+    ingredient suggestion. Returns None if SkinSafe has no such ingredient;
+    network, HTTP and decoding errors are raised, so a temporary failure is
+    never mistaken for (and cached as) "not found".
     """
-    try:
-        resp = requests.get(
-            SKINSAFE_API,
-            params={"query": ingredient},
-            headers={"User-Agent": "Mozilla/5.0"},
-            timeout=10,
-        )
-        resp.raise_for_status()
-        data = resp.json()
-
-        for suggestion in data.get("suggestions", []):
-            if suggestion.get("landing_page") == "ingredient":
-                return SKINSAFE_BASE + suggestion["url"]
-
-    except Exception as e:
-        print(f"  [SkinSafe API] lookup failed for '{ingredient}': {e}")
+    resp = _http.get(SKINSAFE_API, params={"query": ingredient})
+    resp.raise_for_status()
 
+    for suggestion in resp.json().get("suggestions", []):
+        if suggestion.get("landing_page") == "ingredient":
+            return SKINSAFE_BASE + suggestion["url"]
     return None
 
 
 def _apply_name_based_nos(ingredient: str, badges: dict) -> dict:
-    ing_lower = ingredient.lower()
-    for field_name, keywords in _NAME_CONTAINS_NO.items():
-        if badges.get(field_name) is None:
-            for kw in keywords:
-                if kw in ing_lower:
-                    badges[field_name] = "No"
-                    break
+    # normalize() is memoised: a name asked for again reuses its lowercased form
+    hits = _NAME_NO_MATCH.flags(normalize(ingredient))
+    if hits:
+        for field_name, bit in _NAME_NO_BITS:
+            if hits & bit and badges.get(field_name) is None:
+                badges[field_name] = "No"
     return badges
 
 
+_ASCII_UPPER = b"ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+def _uppercase_count(line: str) -> int:
+    # ASCII lines (nearly all): for them isupper() is exactly A–Z, so delete
+    # those bytes in one C call and compare lengths
+    if line.isascii():
+        return len(line) - len(line.encode("ascii").translate(None, _ASCII_UPPER))
+    return sum(1 for c in line if c.isupper())
+
+
+_LINE      = re.compile(r"[^\n]+")
+_LONG_LINE = re.compile(r"[^\n]{60,}")   # stripping only shortens, so shorter lines never qualify
+
+
+def _heading_end(page_text: str, ing_upper: str) -> int:
+    """
+    End of the first line that starts (after stripping) with ing_upper, or 0
+    if there is none.
+    """
+    text_upper = page_text.upper()
+    if ing_upper and len(text_upper) == len(page_text):
+        # upper() never shortens a character, so equal lengths mean every
+        # character kept its position: a C-level find() jumps straight to the
+        # candidates, and only their lines are checked exactly
+        idx = text_upper.find(ing_upper)
+        while idx >= 0:
+            line_start = page_text.rfind("\n", 0, idx) + 1
+            line_end = page_text.find("\n", idx)
+            if line_end < 0:
+                line_end = len(page_text)
+            line = page_text[line_start:line_end].strip()
+            if line and line.upper().startswith(ing_upper):
+                return line_end
+            idx = text_upper.find(ing_upper, line_end + 1)
+        return 0
+
+    for m in _LINE.finditer(page_text):
+        line = m.group().strip()
+        if line and line.upper().startswith(ing_upper):
+            return m.end()
+    return 0
+
+
+def _is_description(line: str) -> bool:
+    """Whether a stripped line reads like a description paragraph."""
+    return (
+        len(line) >= 60
+        and not _UI_SKIP_MATCH.search(line.lower())
+        and _uppercase_count(line) <= len(line) * 0.5
+    )
+
+
 def _extract_description(page_text: str, ingredient: str) -> Optional[str]:
-    lines = [l.strip() for l in page_text.split("\n") if l.strip()]
-    ing_upper = ingredient.upper()
-
-    heading_idx = None
-    for i, line in enumerate(lines):
-        if line.upper() == ing_upper or line.upper().startswith(ing_upper):
-            heading_idx = i
-            break
-
-    search_lines = lines[heading_idx + 1:] if heading_idx is not None else lines
-
-    for line in search_lines:
-        if len(line) < 60:
-            continue
-        if any(skip in line.lower() for skip in _UI_SKIP):
-            continue
-        if sum(1 for c in line if c.isupper()) > len(line) * 0.5:
-            continue
-        return line[:500]
+    # Lines are matched lazily in the text rather than split into a list:
+    # the heading scan stops at the heading, and the candidate scan only
+    # materialises lines long enough to be a description.
+    start = _heading_end(page_text, ingredient.upper())
+
+    for m in _LONG_LINE.finditer(page_text, start):
+        line = m.group().strip()
+        if _is_description(line):
+            return line[:500]
 
     return None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SkinsafeResult:
+    """
+    Badge values are "Yes" / "No" / None when found; when found is False
+    (no SkinSafe page, or the scrape failed) every badge is NOT_FOUND.
+    Immutable — results are shared between enrichers through the cache.
+    """
     ingredient_name: str
     found:           bool = False
     description:     Optional[str] = None
@@ -146,113 +215,177 @@ class SkinsafeResult:
     error:           Optional[str] = None
 
 
-async def _scrape_one_with_browser(browser, ingredient: str) -> SkinsafeResult:
-    result = SkinsafeResult(ingredient_name=ingredient)
+def _found_result(ingredient: str, hits: int, description: Optional[str]) -> SkinsafeResult:
+    """Build a found result from a page's badge keyword hits and description."""
+    badges: dict = {
+        field_name: "Yes" if hits & bit else None
+        for field_name, bit in _BADGE_BITS
+    }
+    badges = _apply_name_based_nos(ingredient, badges)
+    return SkinsafeResult(
+        ingredient_name=ingredient,
+        found=True,
+        description=description,
+        **badges,
+    )
 
-    # ── Step 1: get URL from API (no browser needed) ──────────────────────────
-    url = _lookup_ingredient_url(ingredient)
-    if not url:
-        for field_name in _BADGE_KEYWORDS:
-            setattr(result, field_name, "Not found")
-        return result
 
-    # ── Step 2: load ingredient page with Playwright ──────────────────────────
-    try:
-        page = await browser.new_page()
-        await page.goto(url, wait_until="networkidle", timeout=30_000)
-        await asyncio.sleep(2)
+# Status codes meaning the ingredient page does not exist (any more)
+_GONE_STATUSES = frozenset({404, 410})
 
-        page_text = await page.inner_text("body")
-        await page.close()
 
-        result.found = True
-        text_lower = page_text.lower()
+# The badges are rendered client-side; wake as soon as one of them is on the page
+_BADGES_RENDERED_JS = """
+words => {
+    const text = document.body ? document.body.innerText.toLowerCase() : "";
+    return words.some(w => text.includes(w));
+}
+"""
 
-        result.description = _extract_description(page_text, ingredient)
 
-        badges: dict = {}
-        for field_name, keywords in _BADGE_KEYWORDS.items():
-            badges[field_name] = None
-            for kw in keywords:
-                if kw in text_lower:
-                    badges[field_name] = "Yes"
-                    break
+# ── Page memo ─────────────────────────────────────────────────────────────────
+# Different spellings of an ingredient ("Aqua", "Aqua (Water)", "AQUA.") get
+# their own cache keys but the search API sends them to the same page. The
+# page is kept per URL as a _PageSummary, so each page is rendered once; the
+# result is still built per name, since the description heading and the
+# name-based "No" flags depend on it. None marks a gone page.
 
-        badges = _apply_name_based_nos(ingredient, badges)
-        for field_name, value in badges.items():
-            setattr(result, field_name, value)
+_PAGE_MEMO_SIZE = 1024
+_LINE_KEEP      = 500   # a description is cut to this; headings are names, far shorter
 
-    except Exception as e:
-        try:
-            await page.close()
-        except Exception:
-            pass
-        result.error = str(e)
-        for field_name in _BADGE_KEYWORDS:
-            setattr(result, field_name, "Not found")
 
-    return result
+@dataclass(slots=True, frozen=True)
+class _PageSummary:
+    """
+    What _extract_description reads from a page, without the page itself:
+    every non-empty line, stripped and cut to _LINE_KEEP characters, and the
+    indices of those that qualify as a description.
+    """
+    hits:         int
+    lines:        Tuple[str, ...]
+    descriptions: Tuple[int, ...]
+
+    @classmethod
+    def of(cls, page_text: str, hits: int) -> "_PageSummary":
+        lines = list(filter(None, (m.group().strip() for m in _LINE.finditer(page_text))))
+        return cls(
+            hits=hits,
+            lines=tuple(line[:_LINE_KEEP] for line in lines),
+            descriptions=tuple(i for i, line in enumerate(lines) if _is_description(line)),
+        )
+
+    def description(self, ingredient: str) -> Optional[str]:
+        """Same as _extract_description on the page, for names up to _LINE_KEEP long."""
+        ing_upper = ingredient.upper()
+        start = next(
+            (i + 1 for i, line in enumerate(self.lines) if line.upper().startswith(ing_upper)),
+            0,
+        )
+        return next((self.lines[i] for i in self.descriptions if i >= start), None)
+
 
+_page_memo: Dict[str, Optional[_PageSummary]] = {}
+_page_memo_lock = threading.Lock()
+_UNSEEN = object()
 
-async def _scrape_batch(ingredients: list, delay_seconds: float = 1.0) -> list:
-    from playwright.async_api import async_playwright
 
-    results = []
-    total = len(ingredients)
+def _remember_page(url: str, page: Optional[_PageSummary]) -> None:
+    with _page_memo_lock:
+        if url not in _page_memo and len(_page_memo) >= _PAGE_MEMO_SIZE:
+            del _page_memo[next(iter(_page_memo))]   # oldest first
+        _page_memo[url] = page
 
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
 
-        for i, ingredient in enumerate(ingredients):
-            print(f"  [{i+1}/{total}] SkinSafe: {ingredient[:60]}...")
-            result = await _scrape_one_with_browser(browser, ingredient)
+def _from_page(ingredient: str, page: Optional[_PageSummary]) -> SkinsafeResult:
+    if page is None:
+        return SkinsafeResult(ingredient_name=ingredient, **_NOT_FOUND_BADGES)
+    return _found_result(ingredient, page.hits, page.description(ingredient))
 
-            if result.found:
-                print(f"           ✓ found")
-            elif result.error:
-                print(f"           ✗ error — {result.error}")
-            else:
-                print(f"           ✗ not found")
 
-            results.append(result)
-            await asyncio.sleep(delay_seconds)
+async def _scrape_one(
+    browser: LazyBrowser,
+    ingredient: str,
+    delay_seconds: Optional[float] = None,
+) -> SkinsafeResult:
+    # ── Step 1: get URL from API (no browser needed) ──────────────────────────
+    # requests blocks on DNS + socket I/O; run it off the event loop so other
+    # pages in a batch keep loading meanwhile
+    loop = asyncio.get_running_loop()
+    try:
+        url = await loop.run_in_executor(None, _lookup_ingredient_url, ingredient)
+    except Exception as e:
+        log.warning("SkinSafe lookup failed for %r: %s", ingredient, e)
+        return SkinsafeResult(ingredient_name=ingredient, error=str(e), **_NOT_FOUND_BADGES)
+    if not url:
+        return SkinsafeResult(ingredient_name=ingredient, **_NOT_FOUND_BADGES)
+    with _page_memo_lock:
+        seen = _page_memo.get(url, _UNSEEN)
+    if seen is not _UNSEEN:
+        return _from_page(ingredient, seen)
+
+    # ── Step 2: render the page with Playwright ───────────────────────────────
+    try:
+        async with browser.page() as page:
+            await LIMITER.wait_async(url, delay_seconds)
+            resp = await page.goto(url, wait_until="domcontentloaded", timeout=30_000)
+            if resp is not None and resp.status in _GONE_STATUSES:
+                _remember_page(url, None)
+                return _from_page(ingredient, None)
+            await wait_quietly(page.wait_for_function(
+                _BADGES_RENDERED_JS, arg=_BADGE_WORDS, polling=250, timeout=5_000,
+            ))
+            page_text = await page.inner_text("body")
+
+        hits = _BADGE_MATCH.flags(page_text.lower())
+        _remember_page(url, _PageSummary.of(page_text, hits))
+        return _found_result(ingredient, hits, _extract_description(page_text, ingredient))
 
-        await browser.close()
+    except Exception as e:
+        return SkinsafeResult(ingredient_name=ingredient, error=str(e), **_NOT_FOUND_BADGES)
 
-    return results
 
+# ── Shared browser ────────────────────────────────────────────────────────────
+# Every found ingredient page is rendered, so single lookups share one browser
+# on the scraper loop, as in scrapers.cosing, instead of launching Chromium
+# per ingredient.
 
-_cache: dict = {}
+_browser = shared_browser()
 
 
-def scrape_skinsafe(ingredient: str) -> SkinsafeResult:
-    key = ingredient.strip().lower()
-    if key in _cache:
-        return _cache[key]
+_cache = ScrapeCache("skinsafe", SkinsafeResult)
+
 
-    async def _run():
-        from playwright.async_api import async_playwright
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            r = await _scrape_one_with_browser(browser, ingredient)
-            await browser.close()
-            return r
+def scrape_skinsafe(ingredient: str) -> SkinsafeResult:
+    """
+    Synchronous wrapper — call this from enrichers.
+    SafetyEnricher, AgeGroupEnricher and DietaryEnricher all ask for the same
+    ingredient; the shared cache makes sure only the first call hits SkinSafe.
+    """
+    def _fetch():
+        with LIMITER.slots(SKINSAFE_API):
+            return _loop.run(_scrape_one(_browser, ingredient))
 
-    result = asyncio.run(_run())
-    _cache[key] = result
-    return result
+    return _cache.get_or_fetch(normalize_key(ingredient), _fetch)
 
 
-def scrape_skinsafe_batch_sync(ingredients: list, delay_seconds: float = 1.0) -> list:
-    to_scrape = [i for i in ingredients if i.strip().lower() not in _cache]
+def scrape_skinsafe_batch_sync(
+    ingredients: list,
+    delay_seconds: float = 1.0,
+    concurrency: Optional[int] = None,
+) -> list:
+    to_scrape = _cache.missing(ingredients)
 
     if to_scrape:
-        fresh = asyncio.run(_scrape_batch(to_scrape, delay_seconds))
+        fresh = asyncio.run(scrape_batch(
+            _scrape_one, to_scrape, "SkinSafe", delay_seconds, concurrency,
+        ))
         for r in fresh:
-            _cache[r.ingredient_name.strip().lower()] = r
+            _cache[normalize_key(r.ingredient_name)] = r
 
-    return [_cache[i.strip().lower()] for i in ingredients]
+    return [_cache[normalize_key(i)] for i in ingredients]
 
 
 def clear_cache() -> None:
-    _cache.clear()
\ No newline at end of file
+    _cache.clear()
+    with _page_memo_lock:
+        _page_memo.clear()
\ No newline at end of file